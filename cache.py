@@ -1,4 +1,5 @@
 import json
+import os
 import time
 from email.utils import parsedate_to_datetime
 
@@ -8,33 +9,82 @@ class Cache:
 
     Values may be dicts (TTL checked via ts_field) or raw floats (TTL is the
     value itself — used for {url: timestamp} caches like shown_articles).
+    Pass indent=None to write compact JSON for caches nobody reads by hand.
+
+    load() skips re-reading while the file is unchanged since this instance
+    last read or wrote it — several pipeline stages load the scored cache in
+    one run. Each call parses its own copy of the last-saved text, so
+    in-place edits a caller never saves can't leak into later loads.
+    save() leaves the file alone when the serialized text is what is already
+    on disk.
     """
 
-    def __init__(self, path: str, ttl_hours: float = None, ts_field: str = 'timestamp'):
+    def __init__(self, path: str, ttl_hours: float = None, ts_field: str = 'timestamp',
+                 indent: int = 2):
         self.path = path
         self.ttl_sec = ttl_hours * 3600 if ttl_hours is not None else None
         self.ts_field = ts_field
+        self.indent = indent
+        self._loaded = False
+        self._text = None
+        self._signature = None
+
+    def _file_signature(self):
+        # ctime and inode catch rewrites that keep the size and restore the
+        # mtime (os.utime can set mtime but not ctime); renames change inode.
+        try:
+            st = os.stat(self.path)
+            return (st.st_mtime_ns, st.st_ctime_ns, st.st_ino, st.st_size)
+        except OSError:
+            return None
 
     def load(self) -> dict:
+        signature = self._file_signature()
+        if not self._loaded or signature != self._signature:
+            try:
+                with open(self.path) as f:
+                    self._text = f.read()
+            except FileNotFoundError:
+                self._text = None
+            self._loaded = True
+            self._signature = signature
         try:
-            with open(self.path) as f:
-                data = json.load(f)
-            if self.ttl_sec is not None:
-                cutoff = time.time() - self.ttl_sec
-                data = {
-                    k: v for k, v in data.items()
-                    if (v.get(self.ts_field, 0) if isinstance(v, dict) else v) > cutoff
-                }
-            return data
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+            data = json.loads(self._text) if self._text is not None else {}
+        except json.JSONDecodeError:
+            data = {}
+        if self.ttl_sec is not None:
+            cutoff = time.time() - self.ttl_sec
+            data = {
+                k: v for k, v in data.items()
+                if self._timestamp(v) > cutoff
+            }
+        return data
+
+    def _timestamp(self, value) -> float:
+        # Corrupted entries (e.g. bare strings) count as expired.
+        if isinstance(value, dict):
+            value = value.get(self.ts_field, 0)
+        return value if isinstance(value, (int, float)) else 0
 
     def save(self, data: dict) -> None:
         try:
-            with open(self.path, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Serialize first, then write once: json.dumps can use the C
+            # encoder for compact output, json.dump never does.
+            if self.indent is None:
+                text = json.dumps(data, separators=(',', ':'))
+            else:
+                text = json.dumps(data, indent=self.indent)
+            # Entries are often mutated in place, so compare the text rather
+            # than the dicts; an unchanged cache skips the rewrite.
+            if text != self._text or self._file_signature() != self._signature:
+                with open(self.path, 'w') as f:
+                    f.write(text)
         except Exception as e:
             print(f"⚠️ Failed to save {self.path}: {e}")
+            return
+        self._loaded = True
+        self._text = text
+        self._signature = self._file_signature()
 
 
 class FeedHTTPCache:
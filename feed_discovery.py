@@ -10,9 +10,10 @@ import sys
 import json
 import socket
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timezone
 from collections import defaultdict
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Set, Tuple, Optional
 import xml.etree.ElementTree as ET
 from urllib.parse import urlparse, urljoin
 import feedparser
@@ -90,6 +91,12 @@ FEED_PROBE_PATHS = ["/feed", "/rss", "/atom.xml", "/feed.xml", "/index.xml", "/r
 FEED_FETCH_TIMEOUT_SECS = 15
 socket.setdefaulttimeout(FEED_FETCH_TIMEOUT_SECS)
 
+# Page probes hit the same site repeatedly (the page itself, then each of
+# FEED_PROBE_PATHS), so keep its connection alive between requests.
+_http = requests.Session()
+_http.mount('http://', HTTPAdapter(pool_maxsize=8))
+_http.mount('https://', HTTPAdapter(pool_maxsize=8))
+
 # Configuration
 DISCOVERY_CACHE_FILE = 'discovery_cache.json'
 DISCOVERY_OUTPUT_FILE = 'feed_discovery_report.json'
@@ -145,7 +152,7 @@ def _probe_page_for_feeds(page_url: str) -> List[str]:
     feeds = []
     try:
         headers = {'User-Agent': 'Mozilla/5.0 (compatible; FeedDiscovery/1.0)'}
-        resp = requests.get(page_url, headers=headers, timeout=10)
+        resp = _http.get(page_url, headers=headers, timeout=10)
         resp.raise_for_status()
         soup = BeautifulSoup(resp.text, 'html.parser')
         for link in soup.find_all('link', attrs={'rel': 'alternate'}):
@@ -162,7 +169,7 @@ def _probe_page_for_feeds(page_url: str) -> List[str]:
         base = f"{parsed.scheme}://{parsed.netloc}"
         for path in FEED_PROBE_PATHS:
             try:
-                r = requests.head(base + path, timeout=5, allow_redirects=True)
+                r = _http.head(base + path, timeout=5, allow_redirects=True)
                 if r.status_code == 200:
                     feeds.append(base + path)
                     break
@@ -172,13 +179,24 @@ def _probe_page_for_feeds(page_url: str) -> List[str]:
     return list(dict.fromkeys(feeds))
 
 
-def _validate_feed_url(url: str) -> bool:
-    """Return True if feedparser can parse the URL and finds at least one entry."""
+def _parse_valid_feed(url: str) -> Optional[feedparser.FeedParserDict]:
+    """Return the parsed feed if feedparser parses the URL cleanly and finds entries, else None.
+
+    Callers that go on to read the feed use this instead of _validate_feed_url
+    so the feed is only downloaded once.
+    """
     try:
         parsed = feedparser.parse(url)
-        return not parsed.bozo and len(parsed.entries) > 0
     except Exception:
-        return False
+        return None
+    if parsed.bozo or not parsed.entries:
+        return None
+    return parsed
+
+
+def _validate_feed_url(url: str) -> bool:
+    """Return True if feedparser can parse the URL and finds at least one entry."""
+    return _parse_valid_feed(url) is not None
 
 
 class SimpleArticle:
@@ -347,7 +365,7 @@ class FeedDiscovery:
         for source in DISCOVERY_SOURCES:
             print(f"\n🌐 Fetching {source['name']}...")
             try:
-                response = requests.get(source['url'], timeout=30)
+                response = _http.get(source['url'], timeout=30)
                 response.raise_for_status()
                 
                 # Parse OPML
@@ -433,10 +451,10 @@ class FeedDiscovery:
                     norm = feed_url.strip().lower()
                     if norm in self.existing_feeds or norm in seen_feed_urls:
                         continue
-                    if not _validate_feed_url(feed_url):
+                    parsed = _parse_valid_feed(feed_url)
+                    if parsed is None:
                         continue
                     seen_feed_urls.add(norm)
-                    parsed = feedparser.parse(feed_url)
                     title = parsed.feed.get('title', '') or urlparse(feed_url).netloc
                     candidates.append(FeedCandidate(
                         title=title,
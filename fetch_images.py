@@ -5,8 +5,10 @@ Image fetching module with OpenGraph scraping and fallbacks
 
 import json
 import hashlib
+import concurrent.futures
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
@@ -14,6 +16,16 @@ CONFIG_DIR = Path(__file__).parent / 'config'
 CACHE_FILE = Path(__file__).parent / 'image_cache.json'
 CACHE_EXPIRY_DAYS = 30
 
+# Shared session so article pages on the same host reuse a pooled
+# connection instead of paying a TCP+TLS handshake per request.
+_session = requests.Session()
+_session.mount('http://', HTTPAdapter(pool_maxsize=16))
+_session.mount('https://', HTTPAdapter(pool_maxsize=16))
+
+# The page scrapers below only read <meta> and <title>; parsing just those
+# skips building a tree for the (much larger) article body.
+_HEAD_TAGS = SoupStrainer(['meta', 'title'])
+
 def load_image_cache():
     """Load image URL cache"""
     if not CACHE_FILE.exists():
@@ -39,8 +51,9 @@ def load_image_cache():
 def save_image_cache(cache):
     """Save image URL cache"""
     try:
+        # Machine-read only: compact output keeps the C encoder on the fast path.
         with open(CACHE_FILE, 'w') as f:
-            json.dump(cache, f, indent=2)
+            f.write(json.dumps(cache, separators=(',', ':')))
     except Exception as e:
         print(f"⚠️ Failed to save image cache: {e}")
 
@@ -53,10 +66,10 @@ def fetch_opengraph_image(url, timeout=3):
             'Accept': 'text/html,application/xhtml+xml'
         }
         
-        response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+        response = _session.get(url, headers=headers, timeout=timeout, allow_redirects=True)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.text, 'html.parser', parse_only=_HEAD_TAGS)
         
         # Try various OpenGraph image tags
         og_image = soup.find('meta', property='og:image')
@@ -87,10 +100,10 @@ def fetch_page_title(url, timeout=3):
             'Accept': 'text/html,application/xhtml+xml'
         }
 
-        response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+        response = _session.get(url, headers=headers, timeout=timeout, allow_redirects=True)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.text, 'html.parser', parse_only=_HEAD_TAGS)
 
         og_title = soup.find('meta', property='og:title')
         if og_title and og_title.get('content'):
@@ -118,10 +131,13 @@ def get_source_logo(source_url):
         return None
 
 
-def get_article_image(article_url, source_url, cache=None):
+def get_article_image(article_url, source_url, cache=None, prefetched=None):
     """
     Get image for article - tries OpenGraph, falls back to source logo
-    
+
+    prefetched maps article URLs to fetch_opengraph_image results already
+    looked up by the caller.
+
     Returns: (image_url, cache_updated)
     """
     if cache is None:
@@ -133,7 +149,10 @@ def get_article_image(article_url, source_url, cache=None):
         return cache[url_hash].get('image_url'), False
     
     # Try OpenGraph scraping
-    og_image = fetch_opengraph_image(article_url)
+    if prefetched is not None and article_url in prefetched:
+        og_image = prefetched[article_url]
+    else:
+        og_image = fetch_opengraph_image(article_url)
     
     if og_image:
         # Cache successful OpenGraph fetch
@@ -171,6 +190,22 @@ def batch_fetch_images(articles, max_fetch=20):
     cache = load_image_cache()
     cache_updated = False
     images_fetched = 0
+
+    # The loop below scrapes OpenGraph for (at least) the first max_fetch
+    # articles without an image. Fetch those pages concurrently up front;
+    # any extra lookup the loop needs still happens inline.
+    to_fetch = []
+    for article in articles:
+        if len(to_fetch) == max_fetch:
+            break
+        if not (hasattr(article, 'image') and article.image):
+            to_fetch.append(article.link)
+    to_fetch = [url for url in dict.fromkeys(to_fetch)
+                if hashlib.md5(url.encode()).hexdigest() not in cache]
+    prefetched = {}
+    if to_fetch:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(to_fetch))) as pool:
+            prefetched = dict(zip(to_fetch, pool.map(fetch_opengraph_image, to_fetch)))
     
     for i, article in enumerate(articles):
         # Check if article already has an image
@@ -180,7 +215,7 @@ def batch_fetch_images(articles, max_fetch=20):
         # For first max_fetch articles, try OpenGraph
         # For rest, just use favicon fallback
         if images_fetched < max_fetch:
-            image_url, updated = get_article_image(article.link, article.source_url, cache)
+            image_url, updated = get_article_image(article.link, article.source_url, cache, prefetched)
             if updated:
                 cache_updated = True
             if image_url:
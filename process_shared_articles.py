@@ -26,7 +26,6 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from urllib.parse import urlparse
 
-import feedparser
 import requests
 from bs4 import BeautifulSoup
 
@@ -131,9 +130,11 @@ def find_new_source_candidate(url: str, existing_feeds: set, interests_text: str
     """Probe a shared article's page for an RSS feed and score it. Returns a candidate dict or None."""
     for feed_url in feed_discovery._probe_page_for_feeds(url):
         norm = feed_url.strip().lower()
-        if norm in existing_feeds or not feed_discovery._validate_feed_url(feed_url):
+        if norm in existing_feeds:
+            continue
+        parsed = feed_discovery._parse_valid_feed(feed_url)
+        if parsed is None:
             continue
-        parsed = feedparser.parse(feed_url)
         title = parsed.feed.get('title', '') or urlparse(feed_url).netloc
         sample = [
             feed_discovery.SimpleArticle(entry, title, url)
@@ -8,8 +8,12 @@ import os
 import sys
 import json
 import hashlib
+import heapq
 import re
 import concurrent.futures
+import contextlib
+import functools
+import threading
 from html import escape as html_escape
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
@@ -19,6 +23,8 @@ from pathlib import Path
 
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from difflib import SequenceMatcher
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, quote
@@ -147,9 +153,9 @@ def us_policy_scope(title: str, description: str) -> Optional[str]:
     'out-of-jurisdiction' for pure US-jurisdiction stories.
     """
     text = f"{title} {description or ''}".lower()
-    if not any(kw in text for kw in US_POLICY_KEYWORDS):
+    if not _US_POLICY_RE.search(text):
         return None
-    if any(kw in text for kw in CANADIAN_CONTEXT_KEYWORDS):
+    if _CANADIAN_CONTEXT_RE.search(text):
         return 'cross-border-impact'
     return 'out-of-jurisdiction'
 
@@ -169,6 +175,18 @@ def min_score_for_category(category: str) -> int:
 
 _brave_call_count = 0
 _brave_quota_exceeded = False
+# The Brave fallback runs inside the feed fetch pool; guard the shared counter.
+_brave_lock = threading.Lock()
+
+# Concurrent OPML feed fetches in main(). Kept modest so a single run doesn't
+# look like a burst to the small local-news hosts in the list.
+FEED_FETCH_WORKERS = 8
+# Concurrent page loads against a single host (WLT bodies, local-news
+# excerpts). These run alongside the feed pool, so stay well below it.
+SAME_HOST_FETCH_WORKERS = 4
+# Concurrent Claude batch requests within one scoring stage. Small enough to
+# stay well inside the account's per-minute rate limits.
+CLAUDE_BATCH_WORKERS = 4
 
 # Cache files
 SCORED_CACHE_FILE = SYSTEM['cache_files']['scored_articles']
@@ -194,13 +212,63 @@ WLT_BASE_URL = SYSTEM['urls']['wlt_base']
 WLT_NEWS_URL = SYSTEM['urls']['wlt_news']
 
 # Cache instances (simple dict caches with TTL)
-_scored_cache = Cache(SCORED_CACHE_FILE, ttl_hours=SYSTEM['cache_expiry']['scored_hours'])
-_extract_cache = Cache(EXTRACT_CACHE_FILE, ttl_hours=SYSTEM['cache_expiry']['scored_hours'])
-_wlt_cache = Cache(WLT_CACHE_FILE, ttl_hours=SYSTEM['cache_expiry']['scored_hours'])
-_shown_cache = Cache(SHOWN_CACHE_FILE, ttl_hours=SYSTEM['cache_expiry']['shown_days'] * 24)
-_shown_terms_cache = Cache(SHOWN_TERMS_CACHE_FILE, ttl_hours=SYSTEM['cache_expiry']['shown_days'] * 24, ts_field='ts')
+_scored_cache = Cache(SCORED_CACHE_FILE, ttl_hours=SYSTEM['cache_expiry']['scored_hours'], indent=None)
+_extract_cache = Cache(EXTRACT_CACHE_FILE, ttl_hours=SYSTEM['cache_expiry']['scored_hours'], indent=None)
+_wlt_cache = Cache(WLT_CACHE_FILE, ttl_hours=SYSTEM['cache_expiry']['scored_hours'], indent=None)
+_shown_cache = Cache(SHOWN_CACHE_FILE, ttl_hours=SYSTEM['cache_expiry']['shown_days'] * 24, indent=None)
+_shown_terms_cache = Cache(SHOWN_TERMS_CACHE_FILE, ttl_hours=SYSTEM['cache_expiry']['shown_days'] * 24,
+                           ts_field='ts', indent=None)
+# TTL pruning and versioning live in load/save_theme_score_cache; the Cache
+# instance keeps the multi-MB file from being re-read by every stage.
+_theme_score_file = Cache(THEME_SCORE_CACHE_FILE, indent=None)
 _feed_http_cache = FeedHTTPCache(FEED_HTTP_CACHE_FILE)
 
+
+def _build_http_session() -> requests.Session:
+    """Shared keep-alive session for feed, publisher-page and Kite requests.
+
+    Many feeds share hosts (Black Press sites, Substack, Google News), so
+    pooled connections skip a TCP+TLS handshake per request. Retries cover
+    connection failures and transient 5xx only: 429/503 stay with the
+    caller so FeedHTTPCache can honour Retry-After, and read timeouts are
+    not retried so the Brave/Kagi feed fallbacks still kick in promptly.
+    Paid search APIs (Brave, Kagi) use _paid_api_http instead so a retry
+    can never double-bill.
+    """
+    retry = Retry(
+        total=2, connect=1, read=False, status=2,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 504),
+        allowed_methods=frozenset({'GET'}),
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=16, max_retries=retry)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+_http = _build_http_session()
+
+# Keep-alive session for the paid Brave/Kagi APIs. Its adapters keep the
+# requests default of no retries, so each call is still billed at most once;
+# only the TCP+TLS handshake is shared (the Kagi Summarizer loop alone makes
+# one request per thin article).
+_paid_api_http = requests.Session()
+
+
+@functools.lru_cache(maxsize=None)
+def _anthropic_client(api_key: str) -> anthropic.Anthropic:
+    """One Claude client per key for the whole run.
+
+    The client owns an httpx connection pool; sharing it lets the gate,
+    scoring, scrub and theme stages reuse warm connections instead of each
+    stage opening its own. It is safe to use from the _call_batches threads.
+    """
+    return anthropic.Anthropic(api_key=api_key)
+
 # ---------------------------------------------------------------------------
 # URL canonicalization
 # ---------------------------------------------------------------------------
@@ -221,6 +289,9 @@ def canonicalize_url(url: str) -> str:
     Two URLs that differ only in UTM tags or similar tracking parameters
     should be treated as the same article.
     """
+    # No '?' means no query string to clean, so most feed links skip urlparse.
+    if '?' not in url:
+        return url
     try:
         parsed = urlparse(url)
         if not parsed.query:
@@ -232,6 +303,16 @@ def canonicalize_url(url: str) -> str:
         return url
 
 
+def _url_hash(url: str) -> str:
+    """Return the cache key for an article URL (md5 of the canonical URL).
+
+    The hex digest keys the scored, shown, extract and shown-terms caches on
+    disk, so the format must not change — a new digest would orphan every
+    persisted entry and trigger a paid re-score of the whole backlog.
+    """
+    return hashlib.md5(canonicalize_url(url).encode(), usedforsecurity=False).hexdigest()
+
+
 _AGGREGATOR_DOMAINS = frozenset({'news.google.com'})
 
 def _is_aggregator_url(url: str) -> bool:
@@ -279,10 +360,6 @@ def fetch_topic_news(cutoff_date: datetime) -> List['Article']:
     now = datetime.now(timezone.utc)
     freshness_range = f"{cutoff_date.strftime('%Y-%m-%d')}to{now.strftime('%Y-%m-%d')}"
 
-    class _SyntheticEntry:
-        def get(self, key, default=''):
-            return default
-
     def _make_article(url: str, title: str, snippet: str, pub_str: str, label: str):
         parsed_url = urlparse(url)
         if not (parsed_url.scheme and parsed_url.netloc):
@@ -291,15 +368,14 @@ def fetch_topic_news(cutoff_date: datetime) -> List['Article']:
         domain = parsed_url.netloc.lower()
         if domain.startswith('www.'):
             domain = domain[4:]
-        article = Article(_SyntheticEntry(), domain, source_url, feed_url='')
+        article = Article(_EMPTY_ENTRY, domain, source_url, feed_url='')
         article.title = title.strip()
         if not article.title:
             return None
         article.link = url
-        article.url_hash = hashlib.md5(canonicalize_url(url).encode()).hexdigest()
+        article.url_hash = _url_hash(url)
         article.description = '' if _is_tagline_boilerplate(snippet) else snippet
-        article.summary = _clean_text(article.description, max_chars=300)
-        article.excerpt = _clean_text(article.description, max_chars=600)
+        article.summary, article.excerpt = _summary_and_excerpt(article.description)
         if pub_str:
             try:
                 article.pub_date = datetime.fromisoformat(pub_str.replace('Z', '+00:00'))
@@ -321,7 +397,7 @@ def fetch_topic_news(cutoff_date: datetime) -> List['Article']:
             return []
         try:
             api_usage.record_call('brave')
-            resp = requests.get(
+            resp = _paid_api_http.get(
                 'https://api.search.brave.com/res/v1/news/search',
                 headers={'X-Subscription-Token': brave_key, 'Accept': 'application/json'},
                 params={'q': query, 'count': 20, 'freshness': freshness_range},
@@ -364,7 +440,7 @@ def fetch_topic_news(cutoff_date: datetime) -> List['Article']:
             api_usage.record_call('kagi')
             default_limit = SOURCE_PREFS.get('kagi_search_result_limit', 10)
             limit = query_config.get('max_results', default_limit)
-            resp = requests.post(
+            resp = _paid_api_http.post(
                 'https://kagi.com/api/v1/search',
                 headers={'Authorization': f'Bearer {kagi_key}'},
                 json={'query': query, 'limit': limit},
@@ -450,20 +526,15 @@ def fetch_kite_news(cutoff_date: datetime) -> List['Article']:
             domain = domain[4:]
         source_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
 
-        class _SyntheticEntry:
-            def get(self, key, default=''):
-                return default
-
-        article = Article(_SyntheticEntry(), domain, source_url, feed_url='')
+        article = Article(_EMPTY_ENTRY, domain, source_url, feed_url='')
         article.title = (story.get('title') or '').strip()
         if not article.title:
             return None
         article.link = url
-        article.url_hash = hashlib.md5(canonicalize_url(url).encode()).hexdigest()
+        article.url_hash = _url_hash(url)
         description = story.get('short_summary', '') or ''
         article.description = description
-        article.summary = _clean_text(description, max_chars=300)
-        article.excerpt = _clean_text(description, max_chars=600)
+        article.summary, article.excerpt = _summary_and_excerpt(description)
         image = (story.get('primary_image') or {}).get('url')
         if image:
             article.image = image
@@ -480,8 +551,8 @@ def fetch_kite_news(cutoff_date: datetime) -> List['Article']:
 
     try:
         api_usage.record_call('kite')
-        resp = requests.get(f"{base_url}/api/batches/latest/categories",
-                             headers=headers, params={'lang': 'en'}, timeout=15)
+        resp = _http.get(f"{base_url}/api/batches/latest/categories",
+                         headers=headers, params={'lang': 'en'}, timeout=15)
         resp.raise_for_status()
         categories = resp.json().get('categories') or []
     except Exception as e:
@@ -500,7 +571,7 @@ def fetch_kite_news(cutoff_date: datetime) -> List['Article']:
             continue
         try:
             api_usage.record_call('kite')
-            resp = requests.get(
+            resp = _http.get(
                 f"{base_url}/api/batches/latest/categories/{category_id}/stories",
                 headers=headers,
                 params={'limit': max_per_category, 'lang': 'en'},
@@ -550,9 +621,16 @@ _STOPWORDS = frozenset({
     'vs', 'via', 'amid', 'amid', 'inside', 'following',
 })
 
+_WORD_RE = re.compile(r'[a-z0-9]+')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+# Leading 🔓 marker(s) and "[Source] " prefix that feed output adds to titles
+_UNLOCK_PREFIX_RE = re.compile(r'^(?:🔓\s*)+')
+_SOURCE_PREFIX_RE = re.compile(r'^\[.*?\]\s*')
+
+
 def _term_set(text: str) -> frozenset:
     """Return the set of meaningful words from a headline."""
-    words = re.findall(r'[a-z0-9]+', text.lower())
+    words = _WORD_RE.findall(text.lower())
     return frozenset(w for w in words if len(w) > 2 and w not in _STOPWORDS)
 
 
@@ -568,12 +646,49 @@ def _story_overlap(a: frozenset, b: frozenset) -> float:
     return len(a & b) / min(len(a), len(b))
 
 
+def _index_term_sets(term_sets: List[frozenset]) -> Dict[str, List[int]]:
+    """Map each term to the positions of the term sets that contain it."""
+    index: Dict[str, List[int]] = defaultdict(list)
+    for i, terms in enumerate(term_sets):
+        for term in terms:
+            index[term].append(i)
+    return index
+
+
+def _overlaps_indexed(terms: frozenset, term_sets: List[frozenset],
+                      index: Dict[str, List[int]], threshold: float,
+                      min_shared: int = 0) -> bool:
+    """True if _story_overlap(terms, s) >= threshold for any s in term_sets
+    that also shares at least min_shared terms.
+
+    Only sets sharing at least one term are compared — with no shared terms
+    the overlap is 0 — so the cost tracks shared vocabulary, not history size.
+    """
+    candidates = set()
+    for term in terms:
+        candidates.update(index.get(term, ()))
+    return any(
+        _story_overlap(terms, term_sets[i]) >= threshold
+        and len(terms & term_sets[i]) >= min_shared
+        for i in candidates
+    )
+
+
 def _clean_text(html_or_text: str, max_chars: int = 0) -> str:
     """Strip HTML tags and normalize whitespace. Truncate at a word boundary if max_chars > 0."""
     if not html_or_text:
         return ''
+    # Without tags or entities the parser would hand the text back unchanged,
+    # so plain-text descriptions skip building a soup.
+    if '<' not in html_or_text and '&' not in html_or_text:
+        return _truncate_at_word(' '.join(html_or_text.split()), max_chars)
     text = BeautifulSoup(html_or_text, 'html.parser').get_text(' ', strip=True)
     text = ' '.join(text.split())
+    return _truncate_at_word(text, max_chars)
+
+
+def _truncate_at_word(text: str, max_chars: int) -> str:
+    """Truncate already-clean text at the last word boundary before max_chars."""
     if max_chars and len(text) > max_chars:
         truncated = text[:max_chars]
         # Break at the last space so we don't cut mid-word
@@ -582,6 +697,12 @@ def _clean_text(html_or_text: str, max_chars: int = 0) -> str:
     return text
 
 
+def _summary_and_excerpt(html_or_text: str) -> Tuple[str, str]:
+    """Return the 300-char summary and 600-char excerpt from a single HTML parse."""
+    text = _clean_text(html_or_text)
+    return _truncate_at_word(text, 300), _truncate_at_word(text, 600)
+
+
 def _boilerplate_key(html_or_text: str) -> str:
     """Reduce text to a markup/whitespace/punctuation-insensitive key.
 
@@ -589,17 +710,18 @@ def _boilerplate_key(html_or_text: str) -> str:
     tagline as every item's <description> often vary only in markup (e.g.
     <strong> wrappers) or spacing, which defeats exact string comparison.
     """
-    return re.sub(r'[^a-z0-9]+', '', _clean_text(html_or_text).lower())
+    return _NON_ALNUM_RE.sub('', _clean_text(html_or_text).lower())
 
 
-def _find_boilerplate_keys(descriptions: List[str], channel_key: str = '',
+def _find_boilerplate_keys(keys: List[str], channel_key: str = '',
                            min_repeats: int = 3) -> set:
-    """Return keys of descriptions that are channel boilerplate, not article text.
+    """Return the _boilerplate_key values that are channel boilerplate, not article text.
 
     A description is boilerplate if it matches the channel-level description or
     appears verbatim on min_repeats+ items — real article summaries are unique.
+    Callers pass precomputed keys so each description is only parsed once.
     """
-    counts = Counter(_boilerplate_key(d) for d in descriptions)
+    counts = Counter(keys)
     return {
         key for key, count in counts.items()
         if key and (key == channel_key or count >= min_repeats)
@@ -623,6 +745,10 @@ def _is_tagline_boilerplate(text: str) -> bool:
     return bool(text) and bool(_TAGLINE_BOILERPLATE_RE.search(text))
 
 
+_MD_IMAGE_RE = re.compile(r'!\[([^\]]*)\]\([^)]*\)')
+_MD_LINK_RE = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+
+
 def _strip_markdown_links(text: str) -> str:
     """Convert markdown link syntax to plain text: [text](url) → text, ![alt](url) → alt.
 
@@ -630,10 +756,10 @@ def _strip_markdown_links(text: str) -> str:
     in content_html because feed readers treat the field as HTML, not markdown.
     Safe to apply to HTML content — the pattern doesn't appear in normal HTML.
     """
-    if not text:
+    if not text or '](' not in text:
         return text
-    text = re.sub(r'!\[([^\]]*)\]\([^)]*\)', r'\1', text)  # images first
-    text = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', text)   # then links
+    text = _MD_IMAGE_RE.sub(r'\1', text)  # images first
+    text = _MD_LINK_RE.sub(r'\1', text)   # then links
     return text
 
 
@@ -647,8 +773,90 @@ _LOCAL_BC_DOMAINS = frozenset({
 })
 
 
+@functools.lru_cache(maxsize=8192)
+def _parse_cached_pub_date(value: str) -> datetime:
+    """datetime.fromisoformat for cached pub_date strings, memoized.
+
+    The weekly podcast cache is re-read by every themed feed in a run, so
+    the same strings would otherwise be parsed once per theme. Unlike
+    shown_at/banked_at these carry the source's own UTC offset, so they
+    can't be compared as strings. datetimes are immutable, so sharing is safe.
+    """
+    return datetime.fromisoformat(value)
+
+
+def _entry_pub_date(entry) -> datetime:
+    """Parse publication date from a feed entry, falling back to now."""
+    if hasattr(entry, 'published_parsed') and entry.published_parsed:
+        return datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+    elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
+        return datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc)
+    return datetime.now(timezone.utc)
+
+
+def _substring_pattern(keywords: List[str]) -> re.Pattern:
+    """Compile keywords into one regex that matches wherever any of them occurs.
+
+    pattern.search(text) is equivalent to any(k in text for k in keywords)
+    (matching is case-sensitive, like the substring test). The keywords are
+    merged into a prefix trie, so each text position follows a single branch
+    per character instead of retrying every keyword.
+    """
+    trie: Dict[str, Dict] = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def _build(node: Dict[str, Dict]) -> str:
+        branches = [re.escape(ch) + _build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    if not keywords:
+        return re.compile(r'(?!)')  # never matches
+    return re.compile(_build(trie))
+
+
+_BLOCKED_SOURCE_RE = _substring_pattern(FILTERS['blocked_sources'])
+_BLOCKED_KEYWORD_RE = _substring_pattern(FILTERS['blocked_keywords'])
+_BLOCKED_UNLESS_LOCAL_RE = _substring_pattern(FILTERS.get('blocked_keywords_unless_local', []))
+_LOCAL_SIGNAL_RE = _substring_pattern(FILTERS.get('local_signals', []))
+_BLOCKED_TITLE_RES = [re.compile(p) for p in FILTERS.get('blocked_title_patterns', [])]
+# us_policy_scope runs on every item of every generated feed.
+_US_POLICY_RE = _substring_pattern(sorted(US_POLICY_KEYWORDS))
+_CANADIAN_CONTEXT_RE = _substring_pattern(sorted(CANADIAN_CONTEXT_KEYWORDS))
+
+
+def _title_is_blocked(title: str) -> bool:
+    """Title-only subset of Article.should_filter (blocked keywords + title patterns).
+
+    A keyword in the title is always a keyword in title+description, so this
+    can reject entries before an Article is built without changing results.
+    """
+    title_lower = title.lower()
+    if _BLOCKED_KEYWORD_RE.search(title_lower):
+        return True
+    return any(pattern.search(title_lower) for pattern in _BLOCKED_TITLE_RES)
+
+
 class Article:
     """Represents a single article"""
+
+    # A run holds a few thousand of these; slots drop the per-instance dict.
+    # Fields set after construction by the scoring stages are listed too.
+    __slots__ = (
+        'title', 'link', 'description', 'pub_date', 'source', 'source_url', 'feed_url',
+        'score', 'quality', 'relevance', 'local', 'content_type', 'cohere_scored',
+        'gate_scored', 'q_gate', 'category', 'image', 'url_hash', 'title_normalized',
+        'title_terms', 'story_group', 'summary', 'excerpt',
+        'score_fallback', '_cohere_prescore', '_prescore_hits', '_prescore_is_local',
+        '_filter_memo',
+    )
+
     def __init__(self, entry, source_title: str, source_url: str, feed_url: str = ''):
         is_google_news = 'news.google.com' in feed_url
 
@@ -686,8 +894,9 @@ class Article:
         self.q_gate: Optional[int] = None  # Absolute newsworthiness score, interest-independent (0-100)
         self.category = None
         self.image = self._extract_image(entry)
+        self._filter_memo: Optional[Tuple[Tuple[str, str, str], bool]] = None
 
-        self.url_hash = hashlib.md5(canonicalize_url(self.link).encode()).hexdigest()
+        self.url_hash = _url_hash(self.link)
         self.title_normalized = self.title.lower().strip()
         self.title_terms = _term_set(self.title_normalized)
         self.story_group: Optional[str] = None  # Claude-assigned event label for dedup
@@ -695,16 +904,11 @@ class Article:
         # Plain-text extracts used by the downstream podcast generator as verified
         # source material.  Derived from description at construction time; may be
         # updated later via _fetch_article_excerpt when the description is too short.
-        self.summary = _clean_text(self.description, max_chars=300)
-        self.excerpt = _clean_text(self.description, max_chars=600)
+        self.summary, self.excerpt = _summary_and_excerpt(self.description)
     
     def _parse_date(self, entry) -> datetime:
         """Parse publication date from entry"""
-        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-            return datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-        elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-            return datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc)
-        return datetime.now(timezone.utc)
+        return _entry_pub_date(entry)
 
     def _extract_image(self, entry) -> str:
         """Extract image URL from feed entry metadata"""
@@ -732,36 +936,72 @@ class Article:
         return None
 
     def should_filter(self) -> bool:
-        """Check if article should be filtered out"""
+        """Check if article should be filtered out.
+
+        Checked at fetch time and again before scoring; the verdict is reused
+        while title, description and source are unchanged (fetch paths may
+        rewrite them after construction, so it can't be fixed in __init__).
+        """
+        key = (self.title, self.description, self.source)
+        memo = self._filter_memo
+        if memo is not None and memo[0] == key:
+            return memo[1]
+        result = self._matches_blocklists()
+        self._filter_memo = (key, result)
+        return result
+
+    def _matches_blocklists(self) -> bool:
         text = f"{self.title} {self.description}".lower()
 
-        source_lower = self.source.lower()
-        if any(blocked in source_lower for blocked in FILTERS['blocked_sources']):
+        if _BLOCKED_SOURCE_RE.search(self.source.lower()):
             return True
 
         # blocked_keywords always applies — sports leagues, sports terms, advice columns,
         # and stock jargon are universally unwanted regardless of local signals.
-        if any(keyword in text for keyword in FILTERS['blocked_keywords']):
+        if _BLOCKED_KEYWORD_RE.search(text):
             return True
 
         # Title-pattern blocklist: first-person anecdote listicles ("I ditched...",
         # "My home server...") plus deal/shopping-listicle commerce titles ("43% off",
         # "15 best ice cream makers..."). Patterns match anywhere in the title.
+        # (The keyword half of _title_is_blocked is already covered by text.)
         title_lower = self.title.lower()
-        if any(re.search(pattern, title_lower) for pattern in FILTERS.get('blocked_title_patterns', [])):
+        if any(pattern.search(title_lower) for pattern in _BLOCKED_TITLE_RES):
             return True
 
         # Arts/entertainment keywords are skipped when article mentions local places
         # (e.g. an arena hosts a concert, or a local tournament isn't sports).
-        is_local = any(signal in text for signal in FILTERS.get('local_signals', []))
-        nonlocal_keywords = FILTERS.get('blocked_keywords_unless_local', [])
-        if nonlocal_keywords and not is_local:
-            if any(keyword in text for keyword in nonlocal_keywords):
-                return True
+        if not _LOCAL_SIGNAL_RE.search(text) and _BLOCKED_UNLESS_LOCAL_RE.search(text):
+            return True
 
         return False
 
 
+class _RetainedArticle:
+    """Article-shaped view of an item carried over from a previous feed run.
+
+    Only the fields generate_json_feed reads are set; slots keep the few
+    hundred retained items per category cheap to build.
+    """
+    __slots__ = ('link', 'title', 'description', 'pub_date', 'source', 'source_url',
+                 'score', 'quality', 'relevance', 'local', 'content_type', 'image')
+
+    def __init__(self, item: Dict, pub_date: datetime):
+        author = item['authors'][0]
+        self.link = item['url']
+        self.title = _UNLOCK_PREFIX_RE.sub('', item['title'])
+        self.description = item['content_html']
+        self.pub_date = pub_date  # already parsed for the retention check
+        self.source = author['name']
+        self.source_url = author['url']
+        self.score = item.get('_score', 0)
+        self.quality = item.get('_quality', 0)
+        self.relevance = item.get('_relevance', 0)
+        self.local = item.get('_local_score', 0)
+        self.content_type = item.get('_content_type')
+        self.image = item.get('image')
+
+
 APPLE_NEWS_TITLE_SUFFIX_RE = re.compile(r'\s*[\|–—-]\s*[^|–—-]{1,50}$')
 
 
@@ -771,9 +1011,19 @@ def build_apple_news_search_url(title: str) -> str:
     return f"applenews://search?term={quote(clean_title)}"
 
 
+def _dump_compact_json(path: str, data) -> None:
+    """Write a machine-read cache file as compact JSON in a single write.
+
+    json.dumps without indent runs on the C encoder; json.dump and any
+    indented output fall back to the pure-Python one. Nothing reads these
+    caches by hand, so the smaller, faster form is used.
+    """
+    text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
 
 
-def load_podcast_cache():
+def load_podcast_cache() -> List[Dict]:
     """Load weekly podcast articles cache (7 days retention)"""
     if not os.path.exists(PODCAST_CACHE_FILE):
         return []
@@ -788,7 +1038,7 @@ def load_podcast_cache():
 
         valid_articles = []
         for item in cache_data:
-            pub_date = datetime.fromisoformat(item['pub_date'])
+            pub_date = _parse_cached_pub_date(item['pub_date'])
             if pub_date > cutoff and not _is_aggregator_url(item.get('link', '')):
                 valid_articles.append(item)
 
@@ -799,13 +1049,12 @@ def load_podcast_cache():
         # detection (or via fallback ingest paths that bypass it): a description
         # shared verbatim by 3+ cached articles is channel boilerplate, not
         # article content.
-        boilerplate_keys = _find_boilerplate_keys(
-            [item.get('description', '') for item in valid_articles]
-        )
+        description_keys = [_boilerplate_key(item.get('description', '')) for item in valid_articles]
+        boilerplate_keys = _find_boilerplate_keys(description_keys)
         if boilerplate_keys:
             scrubbed = 0
-            for item in valid_articles:
-                if _boilerplate_key(item.get('description', '')) in boilerplate_keys:
+            for item, key in zip(valid_articles, description_keys):
+                if key in boilerplate_keys:
                     item['description'] = ''
                     item['summary'] = ''
                     item['excerpt'] = ''
@@ -820,7 +1069,7 @@ def load_podcast_cache():
         return []
 
 
-def save_podcast_cache(articles, main_feed_quality: bool = True):
+def save_podcast_cache(articles: List[Article], main_feed_quality: bool = True) -> None:
     """Save articles to weekly podcast cache.
 
     Args:
@@ -871,8 +1120,7 @@ def save_podcast_cache(articles, main_feed_quality: bool = True):
 
         existing.sort(key=lambda x: x['pub_date'], reverse=True)
 
-        with open(PODCAST_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(existing, f, indent=2, ensure_ascii=False)
+        _dump_compact_json(PODCAST_CACHE_FILE, existing)
 
         label = 'main-feed' if main_feed_quality else 'podcast-candidate'
         print(f"💾 Podcast cache updated: {len(existing)} articles ({label}, 7-day window)")
@@ -893,10 +1141,12 @@ def load_theme_holdover_cache() -> Dict:
     try:
         with open(THEME_HOLDOVER_FILE, 'r', encoding='utf-8') as f:
             data = json.load(f)
-        cutoff = datetime.now(timezone.utc) - timedelta(days=THEME_HOLDOVER_TTL_DAYS)
+        # banked_at is always a UTC isoformat() string, so a string comparison
+        # against an ISO cutoff orders the same as parsing each entry.
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=THEME_HOLDOVER_TTL_DAYS)).isoformat()
         pruned = {}
         for day, articles in data.items():
-            valid = [a for a in articles if datetime.fromisoformat(a['banked_at']) > cutoff]
+            valid = [a for a in articles if a['banked_at'] > cutoff]
             if valid:
                 pruned[day] = valid
         return pruned
@@ -905,10 +1155,9 @@ def load_theme_holdover_cache() -> Dict:
         return {}
 
 
-def save_theme_holdover_cache(holdover: Dict):
+def save_theme_holdover_cache(holdover: Dict) -> None:
     try:
-        with open(THEME_HOLDOVER_FILE, 'w', encoding='utf-8') as f:
-            json.dump(holdover, f, indent=2, ensure_ascii=False)
+        _dump_compact_json(THEME_HOLDOVER_FILE, holdover)
     except Exception as e:
         print(f"⚠️ Failed to save theme holdover cache: {e}")
 
@@ -973,7 +1222,9 @@ def load_podcast_shown_cache() -> Dict:
     try:
         with open(PODCAST_SHOWN_FILE, 'r', encoding='utf-8') as f:
             raw = json.load(f)
-        cutoff = datetime.now(timezone.utc) - timedelta(days=PODCAST_SHOWN_TTL_DAYS)
+        # shown_at is a UTC isoformat() string; compare as strings (see
+        # save_theme_score_cache) instead of parsing every entry.
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=PODCAST_SHOWN_TTL_DAYS)).isoformat()
         migrated: Dict = {}
         for key, entry in raw.items():
             # Migrate legacy plain-URL keys to compound "{url}:::{day}" format
@@ -982,7 +1233,7 @@ def load_podcast_shown_cache() -> Dict:
                 new_key = f"{key}:::{day}"
             else:
                 new_key = key
-            if datetime.fromisoformat(entry['shown_at']) > cutoff:
+            if entry['shown_at'] > cutoff:
                 migrated[new_key] = entry
         if len(migrated) != len(raw):
             print(f"🧹 Podcast shown cache: {len(raw)} → {len(migrated)} entries (cleaned/migrated)")
@@ -991,11 +1242,10 @@ def load_podcast_shown_cache() -> Dict:
         return {}
 
 
-def save_podcast_shown_cache(cache: Dict):
+def save_podcast_shown_cache(cache: Dict) -> None:
     """Persist the podcast shown cache to disk."""
     try:
-        with open(PODCAST_SHOWN_FILE, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2, ensure_ascii=False)
+        _dump_compact_json(PODCAST_SHOWN_FILE, cache)
     except Exception as e:
         print(f"⚠️ Failed to save podcast shown cache: {e}")
 
@@ -1010,8 +1260,7 @@ def load_theme_score_cache() -> Dict:
     if not os.path.exists(THEME_SCORE_CACHE_FILE):
         return {}
     try:
-        with open(THEME_SCORE_CACHE_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _theme_score_file.load()
         if data.get('__version__') != THEME_SCORE_CACHE_VERSION:
             print(f"  ♻️  Theme score cache version mismatch — clearing for re-score")
             return {}
@@ -1020,17 +1269,13 @@ def load_theme_score_cache() -> Dict:
         return {}
 
 
-def save_theme_score_cache(cache: Dict):
+def save_theme_score_cache(cache: Dict) -> None:
     """Persist theme score cache, pruning entries older than TTL."""
     cutoff = (datetime.now(timezone.utc) - timedelta(days=THEME_SCORE_CACHE_TTL_DAYS)).isoformat()
     pruned = {k: v for k, v in cache.items()
               if isinstance(v, dict) and v.get('cached_at', '') >= cutoff}
     pruned['__version__'] = THEME_SCORE_CACHE_VERSION
-    try:
-        with open(THEME_SCORE_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(pruned, f)
-    except Exception as e:
-        print(f"⚠️ Failed to save theme score cache: {e}")
+    _theme_score_file.save(pruned)
 
 
 def load_calibration_stats_cache() -> List[Dict]:
@@ -1044,15 +1289,14 @@ def load_calibration_stats_cache() -> List[Dict]:
         return []
 
 
-def save_calibration_stats_cache(records: List[Dict]):
+def save_calibration_stats_cache(records: List[Dict]) -> None:
     try:
-        with open(CALIBRATION_STATS_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(records, f, indent=2, ensure_ascii=False)
+        _dump_compact_json(CALIBRATION_STATS_CACHE_FILE, records)
     except Exception as e:
         print(f"⚠️ Failed to save calibration stats cache: {e}")
 
 
-def record_run_stats(run_stats: Dict):
+def record_run_stats(run_stats: Dict) -> None:
     """Append this run's summary stats to the rolling calibration stats cache,
     pruning entries older than CALIBRATION_STATS_TTL_DAYS.
 
@@ -1062,14 +1306,9 @@ def record_run_stats(run_stats: Dict):
     """
     records = load_calibration_stats_cache()
     records.append(run_stats)
-    cutoff = datetime.now(timezone.utc) - timedelta(days=CALIBRATION_STATS_TTL_DAYS)
-    pruned = []
-    for r in records:
-        try:
-            if datetime.fromisoformat(r['timestamp']) > cutoff:
-                pruned.append(r)
-        except (KeyError, ValueError):
-            continue
+    # Run timestamps are UTC isoformat() strings, so they sort chronologically.
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=CALIBRATION_STATS_TTL_DAYS)).isoformat()
+    pruned = [r for r in records if isinstance(r.get('timestamp'), str) and r['timestamp'] > cutoff]
     save_calibration_stats_cache(pruned)
     print(f"📊 Calibration stats recorded ({len(pruned)} runs in {CALIBRATION_STATS_TTL_DAYS}-day window)")
 
@@ -1127,7 +1366,7 @@ def load_pending_theme_batch() -> Optional[Dict]:
         return None
 
 
-def save_pending_theme_batch(data: Dict):
+def save_pending_theme_batch(data: Dict) -> None:
     try:
         with open(PENDING_THEME_BATCH_FILE, 'w') as f:
             json.dump(data, f)
@@ -1135,7 +1374,7 @@ def save_pending_theme_batch(data: Dict):
         print(f"⚠️ Failed to save pending theme batch metadata: {e}")
 
 
-def clear_pending_theme_batch():
+def clear_pending_theme_batch() -> None:
     try:
         if os.path.exists(PENDING_THEME_BATCH_FILE):
             os.remove(PENDING_THEME_BATCH_FILE)
@@ -1143,7 +1382,7 @@ def clear_pending_theme_batch():
         pass
 
 
-def process_pending_theme_batch(api_key: str):
+def process_pending_theme_batch(api_key: str) -> None:
     """Check if a previously submitted theme batch has completed and cache its results."""
     pending = load_pending_theme_batch()
     if not pending:
@@ -1152,7 +1391,7 @@ def process_pending_theme_batch(api_key: str):
     batch_id = pending['batch_id']
     print(f"🔄 Checking pending theme batch {batch_id}...")
 
-    client = anthropic.Anthropic(api_key=api_key)
+    client = _anthropic_client(api_key)
     try:
         batch_job = client.messages.batches.retrieve(batch_id)
     except Exception as e:
@@ -1263,7 +1502,7 @@ def _fetch_article_excerpt(url: str, max_chars: int = 600) -> str:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,*/*',
         }
-        resp = requests.get(url, headers=headers, timeout=8)
+        resp = _http.get(url, headers=headers, timeout=8)
         resp.raise_for_status()
         soup = BeautifulSoup(resp.text, 'html.parser')
 
@@ -1303,16 +1542,24 @@ def _enrich_thin_local_articles(articles: List['Article']) -> int:
     Brave/Kagi/Google News fallbacks — so local articles get consistent treatment
     regardless of which path sourced them.
     """
+    thin = [article for article in articles
+            if len(article.summary) < 100
+            and any(d in article.link for d in _LOCAL_BC_DOMAINS)]
+    if not thin:
+        return 0
+    # A thin local feed can need a page load per item, which would otherwise
+    # make it the slowest job in the feed pool. These all hit the same small
+    # host, so keep the fan-out well below FEED_FETCH_WORKERS.
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(SAME_HOST_FETCH_WORKERS, len(thin))) as pool:
+        bodies = list(pool.map(
+            lambda article: _fetch_article_excerpt(article.link, max_chars=600), thin))
     fetched = 0
-    for article in articles:
-        if (len(article.summary) < 100
-                and any(d in article.link for d in _LOCAL_BC_DOMAINS)):
-            body = _fetch_article_excerpt(article.link, max_chars=600)
-            if body and not _is_tagline_boilerplate(body):
-                article.description = body
-                article.summary = _clean_text(body, max_chars=300)
-                article.excerpt = _clean_text(body, max_chars=600)
-                fetched += 1
+    for article, body in zip(thin, bodies):
+        if body and not _is_tagline_boilerplate(body):
+            article.description = body
+            article.summary, article.excerpt = _summary_and_excerpt(body)
+            fetched += 1
     return fetched
 
 
@@ -1361,7 +1608,7 @@ def _kagi_enrich_articles(
     for article in to_fetch:
         try:
             api_usage.record_call('kagi')
-            resp = requests.post(
+            resp = _paid_api_http.post(
                 'https://kagi.com/api/v1/extract',
                 headers={'Authorization': f'Bearer {kagi_key}', 'Content-Type': 'application/json'},
                 json={'pages': [{'url': article.link}]},
@@ -1373,9 +1620,8 @@ def _kagi_enrich_articles(
             text = (page.get('markdown') or '').strip()
             if len(text) >= 80:
                 text = _strip_markdown_links(text)
-                article.description = _clean_text(text, max_chars=600)
-                article.summary = _clean_text(text, max_chars=300)
-                article.excerpt = _clean_text(text, max_chars=600)
+                article.summary, article.excerpt = _summary_and_excerpt(text)
+                article.description = article.excerpt
                 cache[article.url_hash] = {'text': article.description, 'timestamp': now_ts}
                 enriched += 1
             else:
@@ -1398,7 +1644,8 @@ def _kagi_enrich_articles(
             print(f"     HTTP {status} body: {body}")
 
 
-def _try_wlt_selector(soup, container_sel, link_sel, title_sel, desc_sel, img_sel, cache):
+def _try_wlt_selector(soup: BeautifulSoup, container_sel: str, link_sel: str, title_sel: str,
+                      desc_sel: str, img_sel: Optional[str], cache: Dict) -> List[Dict]:
     """Attempt to extract articles using a specific set of CSS selectors.
 
     Returns a list of article dicts and the updated cache, or an empty list if
@@ -1408,7 +1655,11 @@ def _try_wlt_selector(soup, container_sel, link_sel, title_sel, desc_sel, img_se
     if not containers:
         return []
 
-    articles = []
+    # First pass: parse the listing cards. Each card becomes a slot of
+    # (url_hash, cached entry or None); uncached articles are held in pending
+    # as (url_hash, title, url, description, image) until their bodies arrive.
+    slots: List[Tuple[str, Optional[Dict]]] = []
+    pending: Dict[str, Tuple[str, str, str, str, Optional[str]]] = {}
     for article_div in containers[:10]:
         try:
             link_elem = article_div.select_one(link_sel) if link_sel else article_div.find('a')
@@ -1428,9 +1679,15 @@ def _try_wlt_selector(soup, container_sel, link_sel, title_sel, desc_sel, img_se
             if 'wltribune.com' not in full_url:
                 continue
 
-            url_hash = hashlib.md5(full_url.encode()).hexdigest()
-            if url_hash in cache:
-                articles.append(cache[url_hash])
+            # The WLT cache has always been keyed by the raw link's md5 (not
+            # the canonical URL's, as _url_hash does), so keep that key.
+            url_hash = hashlib.md5(full_url.encode(), usedforsecurity=False).hexdigest()
+            cached = cache.get(url_hash)
+            if isinstance(cached, dict):
+                slots.append((url_hash, cached))
+                continue
+            if url_hash in pending:
+                slots.append((url_hash, None))
                 continue
 
             title_elem = article_div.select_one(title_sel) if title_sel else None
@@ -1447,29 +1704,45 @@ def _try_wlt_selector(soup, container_sel, link_sel, title_sel, desc_sel, img_se
                     image_url = f"{WLT_BASE_URL}{image_url}"
 
             if title and full_url:
-                # WLT listing pages often have stub descriptions.  Fetch the
-                # article body so the podcast generator has real source text.
-                if len(description) < 100:
-                    body = _fetch_article_excerpt(full_url, max_chars=600)
-                    if body:
-                        description = body
-
-                article_data = {
-                    'title': title,
-                    'link': full_url,
-                    'description': description,
-                    'summary': _clean_text(description, max_chars=300),
-                    'excerpt': _clean_text(description, max_chars=600),
-                    'image': image_url,
-                    'timestamp': datetime.now(timezone.utc).timestamp()
-                }
-                articles.append(article_data)
-                cache[url_hash] = article_data
+                pending[url_hash] = (url_hash, title, full_url, description, image_url)
+                slots.append((url_hash, None))
 
         except Exception as e:
             print(f"  ⚠️ Error parsing WLT article: {e}")
             continue
 
+    # WLT listing pages often have stub descriptions.  Fetch the article
+    # bodies so the podcast generator has real source text — concurrently,
+    # since each is an independent page load.
+    stub_urls = [url for _, _, url, description, _ in pending.values() if len(description) < 100]
+    bodies: Dict[str, str] = {}
+    if stub_urls:
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(SAME_HOST_FETCH_WORKERS, len(stub_urls))) as pool:
+            bodies = dict(zip(stub_urls, pool.map(
+                lambda url: _fetch_article_excerpt(url, max_chars=600), stub_urls)))
+
+    articles = []
+    built: Dict[str, Dict] = {}
+    for url_hash, cached in slots:
+        if cached is not None:
+            articles.append(cached)
+            continue
+        if url_hash not in built:
+            _, title, full_url, description, image_url = pending[url_hash]
+            description = bodies.get(full_url) or description
+            summary, excerpt = _summary_and_excerpt(description)
+            built[url_hash] = cache[url_hash] = {
+                'title': title,
+                'link': full_url,
+                'description': description,
+                'summary': summary,
+                'excerpt': excerpt,
+                'image': image_url,
+                'timestamp': datetime.now(timezone.utc).timestamp()
+            }
+        articles.append(built[url_hash])
+
     return articles
 
 
@@ -1508,7 +1781,7 @@ def scrape_wlt_news() -> List[Dict]:
             'Accept-Language': 'en-CA,en;q=0.9',
         }
 
-        response = requests.get(WLT_NEWS_URL, headers=headers, timeout=10)
+        response = _http.get(WLT_NEWS_URL, headers=headers, timeout=10)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.text, 'html.parser')
@@ -1540,6 +1813,8 @@ class _AttrDict:
     Used to construct Article objects from non-feedparser sources (e.g. Brave Search).
     Attribute access returns None for missing keys so Article's hasattr() guards work.
     """
+    __slots__ = ('_data',)
+
     def __init__(self, data: dict):
         object.__setattr__(self, '_data', data)
 
@@ -1550,6 +1825,11 @@ class _AttrDict:
         return self._data.get(name)
 
 
+# Shared placeholder for Articles built from search/API results; every field
+# is overwritten after construction, so one empty entry serves them all.
+_EMPTY_ENTRY = _AttrDict({})
+
+
 def _fetch_via_brave_fallback(feed: Dict, cutoff_date: datetime) -> List[Article]:
     """Query Brave Search for recent articles from a domain that blocked direct RSS access.
 
@@ -1571,12 +1851,13 @@ def _fetch_via_brave_fallback(feed: Dict, cutoff_date: datetime) -> List[Article
     headers = {'X-Subscription-Token': brave_key, 'Accept': 'application/json'}
 
     global _brave_call_count, _brave_quota_exceeded
-    if _brave_quota_exceeded:
-        return []
-    _brave_call_count += 1
+    with _brave_lock:
+        if _brave_quota_exceeded:
+            return []
+        _brave_call_count += 1
     api_usage.record_call('brave')
     try:
-        resp = requests.get(
+        resp = _paid_api_http.get(
             'https://api.search.brave.com/res/v1/web/search',
             headers=headers, params=params, timeout=15
         )
@@ -1585,12 +1866,12 @@ def _fetch_via_brave_fallback(feed: Dict, cutoff_date: datetime) -> List[Article
     except requests.exceptions.HTTPError as e:
         if e.response is not None and e.response.status_code == 402:
             _brave_quota_exceeded = True
-            print(f"    ⚠️  Brave fallback failed for {domain}: 402 — quota exceeded, disabling Brave for this run")
+            _feed_print(f"    ⚠️  Brave fallback failed for {domain}: 402 — quota exceeded, disabling Brave for this run")
         else:
-            print(f"    ⚠️  Brave fallback failed for {domain}: {e}")
+            _feed_print(f"    ⚠️  Brave fallback failed for {domain}: {e}")
         return []
     except Exception as e:
-        print(f"    ⚠️  Brave fallback failed for {domain}: {e}")
+        _feed_print(f"    ⚠️  Brave fallback failed for {domain}: {e}")
         return []
 
     articles = []
@@ -1656,7 +1937,7 @@ def _fetch_via_kagi_fallback(feed: Dict, cutoff_date: datetime) -> List[Article]
 
     api_usage.record_call('kagi')
     try:
-        resp = requests.post(
+        resp = _paid_api_http.post(
             'https://kagi.com/api/v1/search',
             headers={'Authorization': f'Bearer {kagi_key}'},
             json={'query': f'site:{domain}', 'limit': 10},
@@ -1665,7 +1946,7 @@ def _fetch_via_kagi_fallback(feed: Dict, cutoff_date: datetime) -> List[Article]
         resp.raise_for_status()
         results = (resp.json().get('data') or {}).get('search') or []
     except Exception as e:
-        print(f"    ⚠️  Kagi fallback failed for {domain}: {e}")
+        _feed_print(f"    ⚠️  Kagi fallback failed for {domain}: {e}")
         return []
 
     articles = []
@@ -1733,11 +2014,11 @@ def _fetch_via_google_news_fallback(feed: Dict, cutoff_date: datetime) -> List[A
         'Accept': 'application/rss+xml, application/xml, text/xml, */*',
     }
     try:
-        response = requests.get(gn_url, headers=headers, timeout=10)
+        response = _http.get(gn_url, headers=headers, timeout=10)
         response.raise_for_status()
         parsed = feedparser.parse(response.content)
     except Exception as e:
-        print(f"    ⚠️  Google News fallback failed for {domain}: {e}")
+        _feed_print(f"    ⚠️  Google News fallback failed for {domain}: {e}")
         return []
 
     articles = []
@@ -1756,13 +2037,92 @@ def _fetch_via_google_news_fallback(feed: Dict, cutoff_date: datetime) -> List[A
     return articles
 
 
+# Status lines from a feed fetch running on the main() pool are collected per
+# worker thread and printed in OPML order afterwards: print() from concurrent
+# threads can merge lines, which breaks log_feed_results.py's line parsing.
+_feed_status = threading.local()
+
+
+def _feed_print(message: str) -> None:
+    """print() for the feed fetch path; buffered while a pool worker runs it."""
+    lines = getattr(_feed_status, 'lines', None)
+    if lines is None:
+        print(message)
+    else:
+        lines.append(message)
+
+
+class _LineAtomicWriter:
+    """Text stream wrapper that writes whole lines only, each in one locked call.
+
+    print() writes its text and the trailing newline separately, so lines
+    printed from concurrent threads can merge. Each thread's partial line is
+    held back until its newline arrives.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._lock = threading.Lock()
+        self._pending: Dict[int, str] = {}
+
+    def write(self, text: str) -> int:
+        ident = threading.get_ident()
+        with self._lock:
+            head, newline, tail = (self._pending.pop(ident, '') + text).rpartition('\n')
+            if tail:
+                self._pending[ident] = tail
+            if newline:
+                self._stream.write(head + newline)
+        return len(text)
+
+    def flush(self) -> None:
+        with self._lock:
+            tail = self._pending.pop(threading.get_ident(), '')
+            if tail:
+                self._stream.write(tail)
+            self._stream.flush()
+
+    def drain(self) -> None:
+        """Write out every thread's unterminated text."""
+        with self._lock:
+            for tail in self._pending.values():
+                self._stream.write(tail)
+            self._pending.clear()
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+@contextlib.contextmanager
+def _line_atomic_stdout():
+    """Route print() through a _LineAtomicWriter while worker threads are printing."""
+    original = sys.stdout
+    writer = _LineAtomicWriter(original)
+    sys.stdout = writer
+    try:
+        yield
+    finally:
+        sys.stdout = original
+        writer.drain()
+
+
+def _fetch_feed_with_status(feed: Dict, cutoff_date: datetime) -> Tuple[List[Article], List[str]]:
+    """Run fetch_feed_articles, returning its articles and its status lines."""
+    _feed_status.lines = []
+    try:
+        return fetch_feed_articles(feed, cutoff_date), _feed_status.lines
+    finally:
+        _feed_status.lines = None
+
+
 def fetch_feed_articles(feed: Dict, cutoff_date: datetime) -> List[Article]:
     """Fetch and parse articles from a feed"""
     try:
         feed_url = feed['url']
 
         if _feed_http_cache.should_skip(feed_url):
-            print(f"  ⏭ {feed['title']}: skipped (Cache-Control/Retry-After not yet expired)")
+            _feed_print(f"  ⏭ {feed['title']}: skipped (Cache-Control/Retry-After not yet expired)")
             return []
 
         headers = {
@@ -1771,10 +2131,10 @@ def fetch_feed_articles(feed: Dict, cutoff_date: datetime) -> List[Article]:
         }
         headers.update(_feed_http_cache.request_headers(feed_url))
 
-        response = requests.get(feed_url, headers=headers, timeout=10)
+        response = _http.get(feed_url, headers=headers, timeout=10)
 
         if response.status_code == 304:
-            print(f"  ✓ {feed['title']}: 304 Not Modified (no new articles)")
+            _feed_print(f"  ✓ {feed['title']}: 304 Not Modified (no new articles)")
             return []
 
         if response.status_code in (429, 503):
@@ -1796,25 +2156,39 @@ def fetch_feed_articles(feed: Dict, cutoff_date: datetime) -> List[Article]:
         channel_key = _boilerplate_key(
             parsed.feed.get('description', '') or parsed.feed.get('subtitle', '')
         )
-        boilerplate_keys = _find_boilerplate_keys(
-            [e.get('description', '') or e.get('summary', '') for e in parsed.entries],
-            channel_key,
-        )
+        # Boilerplate feeds repeat the same description verbatim, so key each
+        # distinct string once (the key needs a full HTML parse).
+        key_by_description: Dict[str, str] = {}
+        description_keys = []
+        for e in parsed.entries:
+            description = e.get('description', '') or e.get('summary', '')
+            key = key_by_description.get(description)
+            if key is None:
+                key = key_by_description[description] = _boilerplate_key(description)
+            description_keys.append(key)
+        boilerplate_keys = _find_boilerplate_keys(description_keys, channel_key)
 
         articles = []
         stripped_boilerplate = 0
-        for entry in parsed.entries:
+        # Google News titles carry an outlet suffix that Article strips, so the
+        # raw title isn't safe to pre-filter there — only the date check is.
+        is_google_news = 'news.google.com' in feed_url
+        for entry, description_key in zip(parsed.entries, description_keys):
+            # Cheap rejections first: skip the hashing and HTML cleanup in
+            # Article() for entries that are stale or blocked by title alone.
+            if _entry_pub_date(entry) < cutoff_date:
+                continue
+            if not is_google_news and _title_is_blocked(entry.get('title', '').strip()):
+                continue
+
             article = Article(entry, feed['title'], feed['html_url'], feed['url'])
 
-            if boilerplate_keys and _boilerplate_key(article.description) in boilerplate_keys:
+            if boilerplate_keys and description_key in boilerplate_keys:
                 article.description = ''
                 article.summary = ''
                 article.excerpt = ''
                 stripped_boilerplate += 1
 
-            if article.pub_date < cutoff_date:
-                continue
-
             if article.should_filter():
                 continue
 
@@ -1828,7 +2202,7 @@ def fetch_feed_articles(feed: Dict, cutoff_date: datetime) -> List[Article]:
             extra = f", {fetched_excerpts} body excerpts fetched" if fetched_excerpts else ""
             if stripped_boilerplate:
                 extra += f", {stripped_boilerplate} boilerplate descriptions stripped"
-            print(f"  ✓ {feed['title']}: {len(articles)} articles{extra}")
+            _feed_print(f"  ✓ {feed['title']}: {len(articles)} articles{extra}")
 
         return articles
         
@@ -1846,23 +2220,23 @@ def fetch_feed_articles(feed: Dict, cutoff_date: datetime) -> List[Article]:
         if should_try_fallback and os.environ.get('BRAVE_API_KEY'):
             fallback = _fetch_via_brave_fallback(feed, cutoff_date)
             if fallback:
-                print(f"  ↩ {feed['title']}: Brave fallback → {len(fallback)} articles")
+                _feed_print(f"  ↩ {feed['title']}: Brave fallback → {len(fallback)} articles")
                 return fallback
-            print(f"  ⚠ {feed['title']}: Brave fallback returned 0 articles")
+            _feed_print(f"  ⚠ {feed['title']}: Brave fallback returned 0 articles")
 
         if should_try_fallback and os.environ.get('KAGI_API_KEY'):
             fallback = _fetch_via_kagi_fallback(feed, cutoff_date)
             if fallback:
-                print(f"  ↩ {feed['title']}: Kagi fallback → {len(fallback)} articles")
+                _feed_print(f"  ↩ {feed['title']}: Kagi fallback → {len(fallback)} articles")
                 return fallback
 
         if should_try_fallback:
             fallback = _fetch_via_google_news_fallback(feed, cutoff_date)
             if fallback:
-                print(f"  ↩ {feed['title']}: Google News fallback → {len(fallback)} articles")
+                _feed_print(f"  ↩ {feed['title']}: Google News fallback → {len(fallback)} articles")
                 return fallback
 
-        print(f"  ✗ {feed['title']}: {e}")
+        _feed_print(f"  ✗ {feed['title']}: {e}")
         return []
 
 
@@ -1934,7 +2308,93 @@ def _fuzz_ratio(a: str, b: str) -> int:
 
 
 def _token_sort_ratio(a: str, b: str) -> int:
-    return _fuzz_ratio(' '.join(sorted(a.split())), ' '.join(sorted(b.split())))
+    return _fuzz_ratio(_sorted_tokens(a), _sorted_tokens(b))
+
+
+def _sorted_tokens(text: str) -> str:
+    return ' '.join(sorted(text.split()))
+
+
+def _char_multiset_mask(text: str, bits: Dict[Tuple[str, int], int]) -> int:
+    """Encode the character multiset of text as an int bit vector.
+
+    The k-th occurrence of a character sets the bit for (char, k), so
+    popcount(mask_a & mask_b) is the number of characters the two strings
+    share counting multiplicity — the quantity quick_ratio() is built on.
+    bits assigns those positions (growing as new pairs appear); masks are only
+    comparable when built with the same dict.
+    """
+    occurrences: Dict[str, int] = {}
+    mask = 0
+    for ch in text:
+        k = occurrences.get(ch, 0)
+        occurrences[ch] = k + 1
+        bit = bits.get((ch, k))
+        if bit is None:
+            bit = bits[(ch, k)] = len(bits)
+        mask |= 1 << bit
+    return mask
+
+
+class _FuzzyTitle:
+    """A title prepared for repeated `_fuzz_ratio(other, title) > threshold` checks.
+
+    Holds the title's length and character-multiset vector, plus its
+    per-character position bitmasks and a SequenceMatcher with it as seq2
+    (which caches its index). The latter two are built only when a pair first
+    gets far enough to need them; most titles never do.
+
+    Two upper bounds on ratio() reject most pairs before the full diff. The
+    shared-character bound (quick_ratio, as one AND + popcount of the
+    multiset vectors) also covers the length bound, since two strings never
+    share more characters than the shorter one has. The longest common
+    subsequence bound follows because the matching blocks are a common
+    subsequence, so ratio() never exceeds 2*LCS/total.
+    """
+    __slots__ = ('text', 'length', 'char_mask', 'masks', 'matcher')
+
+    def __init__(self, text: str, char_bits: Dict[Tuple[str, int], int]):
+        """char_bits must be shared by every title this one is compared with."""
+        self.text = text
+        self.length = len(text)
+        self.char_mask = _char_multiset_mask(text, char_bits)
+        self.masks: Optional[Dict[str, int]] = None
+        self.matcher: Optional[SequenceMatcher] = None
+
+    def _lcs_length(self, a: str) -> int:
+        """Length of the longest common subsequence of a and self.text.
+
+        Bit-parallel (Hyyrö): one row of the LCS table per character of a,
+        packed into a Python int, so short titles cost a few int ops per char.
+        """
+        masks = self.masks
+        if masks is None:
+            masks = {}
+            for i, ch in enumerate(self.text):
+                masks[ch] = masks.get(ch, 0) | (1 << i)
+            self.masks = masks
+        full = (1 << len(self.text)) - 1
+        row = full
+        for ch in a:
+            matched = row & masks.get(ch, 0)
+            row = ((row + matched) | (row - matched)) & full
+        return len(self.text) - row.bit_count()
+
+    def ratio_exceeds(self, other: '_FuzzyTitle', threshold: int) -> bool:
+        """True if _fuzz_ratio(other.text, self.text) > threshold."""
+        total = self.length + other.length
+        if not total:
+            return 100 > threshold
+        shared = (self.char_mask & other.char_mask).bit_count()
+        if int(2.0 * shared / total * 100) <= threshold:
+            return False
+        a = other.text
+        if int(2.0 * self._lcs_length(a) / total * 100) <= threshold:
+            return False
+        if self.matcher is None:
+            self.matcher = SequenceMatcher(None, b=self.text)
+        self.matcher.set_seq1(a)
+        return int(self.matcher.ratio() * 100) > threshold
 
 
 def deduplicate_articles(articles: List[Article]) -> List[Article]:
@@ -1955,42 +2415,80 @@ def deduplicate_articles(articles: List[Article]) -> List[Article]:
     ties between sources of equal rank.
     """
     # Preferred sources get processed first so they survive dedup
-    sorted_articles = sorted(articles, key=_source_priority)
+    priority = {id(a): _source_priority(a) for a in articles}
+    sorted_articles = sorted(articles, key=lambda a: priority[id(a)])
+
+    fuzzy_threshold = LIMITS.get('dedup_fuzzy_threshold', 78)
+    overlap_high = LIMITS.get('dedup_overlap_high', 0.55)
+    min_terms_high = LIMITS.get('dedup_min_terms_high', 2)
+    overlap_low = LIMITS.get('dedup_overlap_low', 0.40)
+    min_terms_low = LIMITS.get('dedup_min_terms_low', 3)
 
     seen_urls = set()
-    seen_entries = []   # list of (title_normalized, title_terms, Article)
+    # Exact repeats of a kept title score 100 on the fuzzy check; catch them
+    # with a set lookup before the pairwise loop.
+    seen_titles = set()
+    exact_title_is_dup = fuzzy_threshold < 100
+    # (title_terms, Article, _FuzzyTitle of the title, _FuzzyTitle of its sorted tokens, id)
+    seen_entries = []
     unique = []
 
+    # The term signals need a shared title term unless the config lets a pair
+    # with none match, so an inverted index finds the entries worth computing
+    # them for; every other pair only needs the two fuzzy checks.
+    needs_shared_term = not (
+        (overlap_high <= 0 and min_terms_high <= 0)
+        or (overlap_low <= 0 and min_terms_low <= 0)
+    )
+    term_index: Dict[str, List[int]] = defaultdict(list)
+    char_bits: Dict[Tuple[str, int], int] = {}
+    next_id = 0
+
     for article in sorted_articles:
         if article.url_hash in seen_urls:
             continue
+        title = article.title_normalized
+        if exact_title_is_dup and title in seen_titles:
+            continue
 
         is_duplicate = False
         swap_idx = None
-
-        for idx, (seen_title, seen_terms, seen_article) in enumerate(seen_entries):
-            # Signal 1 & 2: fuzzy string similarity on full title
-            string_sim = max(
-                _fuzz_ratio(article.title_normalized, seen_title),
-                _token_sort_ratio(article.title_normalized, seen_title),
-            )
-            # Signal 3: term-set containment (handles completely different headlines)
-            overlap = (
-                _story_overlap(article.title_terms, seen_terms)
-                if len(article.title_terms) >= 3 and len(seen_terms) >= 3
-                else 0.0
-            )
-            shared_terms = len(article.title_terms & seen_terms) if seen_terms else 0
-
-            is_story_match = (
-                string_sim > LIMITS.get('dedup_fuzzy_threshold', 78)
-                or (overlap >= LIMITS.get('dedup_overlap_high', 0.55) and shared_terms >= LIMITS.get('dedup_min_terms_high', 2))
-                or (overlap >= LIMITS.get('dedup_overlap_low', 0.40) and shared_terms >= LIMITS.get('dedup_min_terms_low', 3))
-            )
+        fuzzy_title = _FuzzyTitle(title, char_bits)
+        fuzzy_sorted = _FuzzyTitle(_sorted_tokens(title), char_bits)
+        terms = article.title_terms
+        sharing = set()
+        for term in terms:
+            sharing.update(term_index.get(term, ()))
+
+        for idx, seen in enumerate(seen_entries):
+            seen_terms, seen_article, seen_fuzzy_title, seen_fuzzy_sorted, seen_id = seen
+            if needs_shared_term and seen_id not in sharing:
+                # Only the fuzzy signals can fire.
+                is_story_match = (
+                    seen_fuzzy_title.ratio_exceeds(fuzzy_title, fuzzy_threshold)
+                    or seen_fuzzy_sorted.ratio_exceeds(fuzzy_sorted, fuzzy_threshold)
+                )
+            else:
+                # Signal 3 first — set arithmetic is far cheaper than a diff.
+                # Term-set containment (handles completely different headlines)
+                overlap = (
+                    _story_overlap(terms, seen_terms)
+                    if len(terms) >= 3 and len(seen_terms) >= 3
+                    else 0.0
+                )
+                shared_terms = len(terms & seen_terms) if seen_terms else 0
+
+                is_story_match = (
+                    (overlap >= overlap_high and shared_terms >= min_terms_high)
+                    or (overlap >= overlap_low and shared_terms >= min_terms_low)
+                    # Signal 1 & 2: fuzzy string similarity on full title
+                    or seen_fuzzy_title.ratio_exceeds(fuzzy_title, fuzzy_threshold)
+                    or seen_fuzzy_sorted.ratio_exceeds(fuzzy_sorted, fuzzy_threshold)
+                )
 
             if is_story_match:
                 # Keep the higher-priority source; swap if current article wins.
-                if _source_priority(article) < _source_priority(seen_article):
+                if priority[id(article)] < priority[id(seen_article)]:
                     swap_idx = idx
                 else:
                     is_duplicate = True
@@ -1998,21 +2496,26 @@ def deduplicate_articles(articles: List[Article]) -> List[Article]:
 
         if swap_idx is not None:
             # Replace the weaker duplicate in-place
-            replaced = seen_entries[swap_idx][2]
+            replaced = seen_entries[swap_idx][1]
             unique.remove(replaced)
+            seen_titles.discard(replaced.title_normalized)
             seen_entries.pop(swap_idx)
             # Fall through to add the current article below
 
         if not is_duplicate:
             seen_urls.add(article.url_hash)
-            seen_entries.append((article.title_normalized, article.title_terms, article))
+            seen_titles.add(title)
+            seen_entries.append((terms, article, fuzzy_title, fuzzy_sorted, next_id))
+            for term in terms:
+                term_index[term].append(next_id)
+            next_id += 1
             unique.append(article)
 
     print(f"🔄 Deduplication: {len(articles)} → {len(unique)} articles")
     return unique
 
 
-def dedup_across_categories(categorized: dict) -> dict:
+def dedup_across_categories(categorized: Dict[str, List[Article]]) -> Dict[str, List[Article]]:
     """Drop news articles that are covered by a more specific category.
 
     After categorization, the same story can appear in both 'news' (via a
@@ -2031,22 +2534,43 @@ def dedup_across_categories(categorized: dict) -> dict:
     if not specific_articles:
         return categorized
 
+    # Per specific article: title terms plus fuzzy-match state for the title
+    # and its sorted-token form, built once instead of per news article.
+    char_bits: Dict[Tuple[str, int], int] = {}
+    specific_entries = [
+        (
+            spec_art.title_terms,
+            _FuzzyTitle(spec_art.title_normalized, char_bits),
+            _FuzzyTitle(_sorted_tokens(spec_art.title_normalized), char_bits),
+        )
+        for spec_art in specific_articles
+    ]
+    # A news title identical to a specific one scores 100 on the fuzzy check.
+    specific_titles = (
+        {spec_art.title_normalized for spec_art in specific_articles}
+        if fuzzy_thresh < 100 else set()
+    )
+
     filtered_news = []
     dropped = 0
     for news_art in categorized.get('news', []):
+        if news_art.title_normalized in specific_titles:
+            dropped += 1
+            continue
         dominated = False
-        for spec_art in specific_articles:
-            sim = max(
-                _fuzz_ratio(news_art.title_normalized, spec_art.title_normalized),
-                _token_sort_ratio(news_art.title_normalized, spec_art.title_normalized),
-            )
+        terms = news_art.title_terms
+        fuzzy_title = _FuzzyTitle(news_art.title_normalized, char_bits)
+        fuzzy_sorted = _FuzzyTitle(_sorted_tokens(news_art.title_normalized), char_bits)
+        for spec_terms, spec_fuzzy_title, spec_fuzzy_sorted in specific_entries:
+            # Term overlap first — set arithmetic is far cheaper than a diff
             ov = (
-                _story_overlap(news_art.title_terms, spec_art.title_terms)
-                if len(news_art.title_terms) >= min_terms and len(spec_art.title_terms) >= min_terms
+                _story_overlap(terms, spec_terms)
+                if len(terms) >= min_terms and len(spec_terms) >= min_terms
                 else 0.0
             )
-            shared = len(news_art.title_terms & spec_art.title_terms)
-            if sim > fuzzy_thresh or (ov >= overlap_thresh and shared >= min_terms):
+            if ((ov >= overlap_thresh and len(terms & spec_terms) >= min_terms)
+                    or spec_fuzzy_title.ratio_exceeds(fuzzy_title, fuzzy_thresh)
+                    or spec_fuzzy_sorted.ratio_exceeds(fuzzy_sorted, fuzzy_thresh)):
                 dominated = True
                 break
         if dominated:
@@ -2121,20 +2645,41 @@ def dedup_by_term_cluster(
     sorted_arts = sorted(articles, key=lambda a: a.score, reverse=True)
     selected: List[Article] = []
     dropped = 0
+    # Term → positions in selected_terms, maintained in the same pass as the
+    # selection so each candidate only scores selected articles it shares a
+    # term with (no shared term means zero overlap).
+    selected_terms: List[frozenset] = []
+    term_index: Dict[str, List[int]] = defaultdict(list)
+
+    def _select(article: Article) -> None:
+        selected.append(article)
+        if article.title_terms:
+            for term in article.title_terms:
+                term_index[term].append(len(selected_terms))
+            selected_terms.append(article.title_terms)
 
     for candidate in sorted_arts:
-        if not candidate.title_terms or len(candidate.title_terms) < 3:
-            selected.append(candidate)
+        terms = candidate.title_terms
+        if not terms or len(terms) < 3:
+            _select(candidate)
             continue
-        cluster_matches = sum(
-            1 for s in selected
-            if s.title_terms
-            and _story_overlap(candidate.title_terms, s.title_terms) >= overlap_threshold
-        )
+        if overlap_threshold > 0:
+            shared_with = set()
+            for term in terms:
+                shared_with.update(term_index.get(term, ()))
+            pool = (selected_terms[i] for i in shared_with)
+        else:
+            pool = iter(selected_terms)
+        cluster_matches = 0
+        for s_terms in pool:
+            if _story_overlap(terms, s_terms) >= overlap_threshold:
+                cluster_matches += 1
+                if cluster_matches >= max_per_cluster:
+                    break
         if cluster_matches >= max_per_cluster:
             dropped += 1
         else:
-            selected.append(candidate)
+            _select(candidate)
 
     if dropped:
         print(f"🗞️  Term-cluster dedup: dropped {dropped} near-duplicate event articles")
@@ -2299,6 +2844,53 @@ def score_articles_with_claude(articles: List[Article], api_key: str) -> List[Ar
         return score_articles_with_claude_pure(articles, api_key)
 
 
+def _call_batches(request, batches: List[List[Article]],
+                  max_workers: int = CLAUDE_BATCH_WORKERS) -> List[Tuple[object, Optional[Exception]]]:
+    """Run request(batch) for every batch; return (result, error) pairs in batch order.
+
+    The first batch runs alone so it writes the prompt cache; the rest then run
+    concurrently and read that cache instead of each paying for a cache write.
+    Results are handed back in order so callers apply them exactly as the old
+    serial loop did.
+    """
+    def _safe(batch):
+        try:
+            return request(batch), None
+        except Exception as e:
+            return None, e
+
+    if not batches:
+        return []
+    results = [_safe(batches[0])]
+    rest = batches[1:]
+    if rest:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(rest))) as pool:
+            results.extend(pool.map(_safe, rest))
+    return results
+
+
+def _title_cache_key(article: Article) -> Optional[str]:
+    """Case- and punctuation-insensitive headline key, or None if too generic.
+
+    Wire stories syndicated under new URLs keep the same headline, so this
+    lets a cached score follow the story rather than the URL. Every word is
+    kept (numbers included) so "wins 4-2" and "wins 3-1" never share a score;
+    headlines with fewer than three meaningful terms are skipped.
+    """
+    if len(article.title_terms) < 3:
+        return None
+    return ' '.join(_WORD_RE.findall(article.title_normalized))
+
+
+def _scored_entries_by_title(cache: Dict, field: str) -> Dict[str, Dict]:
+    """Map title keys to cached score entries that carry a value for field."""
+    by_title: Dict[str, Dict] = {}
+    for entry in cache.values():
+        if isinstance(entry, dict) and entry.get('title_key') and entry.get(field) is not None:
+            by_title[entry['title_key']] = entry
+    return by_title
+
+
 def score_quality_gate(articles: List[Article], api_key: str) -> None:
     """Assign an absolute, interest-independent newsworthiness score (article.q_gate).
 
@@ -2321,11 +2913,27 @@ def score_quality_gate(articles: List[Article], api_key: str) -> None:
     cache = _scored_cache.load()
     local_signals = [s.lower() for s in FILTERS.get('local_signals', [])]
 
+    by_title = _scored_entries_by_title(cache, 'q_gate')
+
     to_score: List[Article] = []
     cached_hits = 0
+    title_hits = 0
     bypassed = 0
     for article in articles:
         entry = cache.get(article.url_hash)
+        if not (isinstance(entry, dict) and entry.get('q_gate') is not None):
+            # Same story under a new URL: reuse the gate score from its headline.
+            # Only q_gate carries over — the other fields belong to the other
+            # URL's entry (and its source), not to this article.
+            title_key = _title_cache_key(article)
+            title_entry = by_title.get(title_key)
+            if title_entry is not None:
+                if not isinstance(entry, dict):
+                    entry = {'timestamp': datetime.now(timezone.utc).timestamp(),
+                             'title_key': title_key}
+                    cache[article.url_hash] = entry
+                entry['q_gate'] = title_entry['q_gate']
+                title_hits += 1
         if isinstance(entry, dict) and entry.get('q_gate') is not None:
             article.q_gate = int(entry['q_gate'])
             cached_hits += 1
@@ -2339,22 +2947,22 @@ def score_quality_gate(articles: List[Article], api_key: str) -> None:
     print(f"\n🚪 Quality gate: {len(to_score)} to score "
           f"({cached_hits} cached, {bypassed} local bypass)")
     if not to_score:
+        # Headline reuse may have added or updated URL entries; keep them.
+        if title_hits:
+            _scored_cache.save(cache)
         return
 
-    client = anthropic.Anthropic(api_key=api_key)
+    client = _anthropic_client(api_key)
     system_blocks = [{
         "type": "text",
         "text": charter,
         "cache_control": {"type": "ephemeral", "ttl": "1h"}
     }]
 
-    timestamp = datetime.now(timezone.utc).timestamp()
-    scored = 0
-    for i in range(0, len(to_score), batch_size):
-        batch = to_score[i:i + batch_size]
+    def _request(batch: List[Article]):
         articles_text = "\n\n".join(
             f"Article {j+1}:\nTitle: {a.title}\nSource: {a.source}\n"
-            f"Description: {(a.description or '')[:200]}"
+            f"Description: {_truncate_at_word(a.summary, 200)}"
             for j, a in enumerate(batch)
         )
         prompt = (
@@ -2363,13 +2971,20 @@ def score_quality_gate(articles: List[Article], api_key: str) -> None:
             '[{"a": 1, "q": 55}, {"a": 2, "q": 12}]\n\n'
             f"Articles:\n{articles_text}"
         )
+        return client.messages.create(
+            model="claude-haiku-4-5",
+            max_tokens=700,
+            system=system_blocks,
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+    timestamp = datetime.now(timezone.utc).timestamp()
+    scored = 0
+    batches = [to_score[i:i + batch_size] for i in range(0, len(to_score), batch_size)]
+    for batch, (response, error) in zip(batches, _call_batches(_request, batches)):
         try:
-            response = client.messages.create(
-                model="claude-haiku-4-5",
-                max_tokens=700,
-                system=system_blocks,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            if error is not None:
+                raise error
             api_usage.record_claude_usage(response.usage)
             response_text = response.content[0].text.strip()
             _start, _end = response_text.find('['), response_text.rfind(']') + 1
@@ -2386,6 +3001,7 @@ def score_quality_gate(articles: List[Article], api_key: str) -> None:
                         cache[article.url_hash] = entry
                     entry['q_gate'] = article.q_gate
                     entry.setdefault('timestamp', timestamp)
+                    entry.setdefault('title_key', _title_cache_key(article))
                     scored += 1
         except Exception as e:
             print(f"  ⚠️ Quality gate batch failed (fail-open): {e}")
@@ -2640,7 +3256,7 @@ def score_articles_with_claude_pure(articles: List[Article], api_key: str) -> Li
         print("⚠️ news interest profile not found, using basic scoring")
         interests = "Technology, science, climate, local news"
 
-    client = anthropic.Anthropic(api_key=api_key)
+    client = _anthropic_client(api_key)
 
     # Load user feedback examples when available (written weekly by feedback_trainer.py).
     feedback_section = ''
@@ -2719,8 +3335,42 @@ def score_articles_with_claude_pure(articles: List[Article], api_key: str) -> Li
 
     scored_articles = []
     uncached = []
+    by_title = _scored_entries_by_title(cache, 'quality')
+    title_hits = 0
+    reuse_timestamp = datetime.now(timezone.utc).timestamp()
+    _gen_weights = SCORING_WEIGHTS.get('general', {})
 
     for article in articles:
+        existing = cache.get(article.url_hash)
+        if not (isinstance(existing, dict) and 'quality' in existing):
+            # Same story under a new URL (wire syndication): reuse the
+            # headline's source-independent dimensions instead of paying for a
+            # re-score. local and category depend on the outlet, so they are
+            # never carried across URLs: local starts at 0 (the local-signal
+            # boost still applies later) and category comes from the keyword
+            # rules.
+            title_key = _title_cache_key(article)
+            title_entry = by_title.get(title_key)
+            if title_entry is not None:
+                quality = int(title_entry['quality'])
+                relevance = int(title_entry.get('relevance', 50))
+                entry = existing if isinstance(existing, dict) else {}
+                entry.update({
+                    'score': min(100, max(0, round(
+                        _gen_weights.get('w_quality', 0.25) * quality
+                        + _gen_weights.get('w_relevance', 0.55) * relevance
+                    ))),
+                    'quality': quality,
+                    'relevance': relevance,
+                    'local': 0,
+                    'content_type': title_entry.get('content_type'),
+                    'category': categorize_article(article.title, article.description) or 'news',
+                    'story_group': title_entry.get('story_group'),
+                    'title_key': title_key,
+                    'timestamp': reuse_timestamp,
+                })
+                cache[article.url_hash] = entry
+                title_hits += 1
         if article.url_hash in cache:
             entry = cache[article.url_hash]
             if 'quality' in entry:
@@ -2746,14 +3396,12 @@ def score_articles_with_claude_pure(articles: List[Article], api_key: str) -> Li
 
     if uncached:
         print(f"\n🤖 Scoring {len(uncached)} new articles with Claude...")
-        print(f"   (using cache for {len(scored_articles)} articles)")
-
-        batch_size = LIMITS.get('claude_scoring_batch_size', 15)
-        for i in range(0, len(uncached), batch_size):
-            batch = uncached[i:i + batch_size]
+        print(f"   (using cache for {len(scored_articles)} articles"
+              + (f", {title_hits} matched by headline" if title_hits else "") + ")")
 
+        def _request(batch: List[Article]):
             articles_text = "\n\n".join([
-                f"Article {j+1}:\nTitle: {article.title}\nSource: {article.source}\nDescription: {article.description[:300]}"
+                f"Article {j+1}:\nTitle: {article.title}\nSource: {article.source}\nDescription: {article.summary}"
                 for j, article in enumerate(batch)
             ])
 
@@ -2768,19 +3416,25 @@ Respond with ONLY a JSON array (no other text):
 Articles to evaluate:
 {articles_text}"""
 
+            return client.messages.create(
+                model="claude-haiku-4-5",
+                max_tokens=1500,
+                system=[
+                    {
+                        "type": "text",
+                        "text": cached_system_prompt,
+                        "cache_control": {"type": "ephemeral", "ttl": "1h"}
+                    }
+                ],
+                messages=[{"role": "user", "content": prompt}]
+            )
+
+        batch_size = LIMITS.get('claude_scoring_batch_size', 15)
+        batches = [uncached[i:i + batch_size] for i in range(0, len(uncached), batch_size)]
+        for batch, (response, error) in zip(batches, _call_batches(_request, batches)):
             try:
-                response = client.messages.create(
-                    model="claude-haiku-4-5",
-                    max_tokens=1500,
-                    system=[
-                        {
-                            "type": "text",
-                            "text": cached_system_prompt,
-                            "cache_control": {"type": "ephemeral", "ttl": "1h"}
-                        }
-                    ],
-                    messages=[{"role": "user", "content": prompt}]
-                )
+                if error is not None:
+                    raise error
 
                 api_usage.record_claude_usage(response.usage)
 
@@ -2838,6 +3492,7 @@ Articles to evaluate:
                             'category': article.category,
                             'story_group': article.story_group,
                             'q_gate': getattr(article, 'q_gate', None),
+                            'title_key': _title_cache_key(article),
                             'timestamp': timestamp
                         }
 
@@ -2870,6 +3525,42 @@ Articles to evaluate:
     return scored_articles
 
 
+# Fixed system prompt for the Haiku scrub. Kept at module level so every batch
+# sends a byte-identical prefix. At ~600 tokens it is below Haiku 4.5's
+# 4096-token caching minimum, so no cache_control is attached here.
+_SCRUB_SYSTEM_PROMPT = (
+    "You are a strict content filter reviewing article headlines.\n\n"
+    "Each headline is prefixed with its category and relevance score, e.g. [ai-tech, score=22].\n\n"
+    "Remove articles whose PRIMARY subject is one of:\n"
+    "- Sports: game scores/recaps, drafts, trades, player stats, sports leagues "
+    "(NFL, NBA, NHL, MLB, CFL, MLS, UFC, MMA, FIFA, PGA, NASCAR, Premier League, "
+    "Champions League, World Cup, Olympics, Super Bowl), sports tournaments, "
+    "championships, playoff coverage, athlete profiles focused on sport performance\n"
+    "- Celebrity gossip: tabloid content, paparazzi, red carpet, award show results, "
+    "celebrity relationships/feuds\n"
+    "- Deals/promotions: promo codes, coupons, flash sales, best deals roundups, "
+    "discount codes\n"
+    "- Advice columns: Dear Abby, Ask Amy, Miss Manners, relationship/dating advice\n"
+    "- Fluffy AI/tech (ONLY for ai-tech or homelab category articles): "
+    "pure funding/valuation announcements ('raises $X million', 'valued at $Y billion', "
+    "'goes public'), product launch press releases with no hands-on content, "
+    "AI benchmark releases with no practical application ('scores X on Y benchmark'), "
+    "conference keynote summaries that are pure announcement without substance, "
+    "'X is transforming Y' hype takes without specific findings or implementation detail. "
+    "Be more lenient for higher-scored articles (score >= 40) — only remove clear fluff.\n\n"
+    "KEEP articles that use sports/entertainment as context for a deeper story "
+    "(e.g. technology in sports, economics of a league, health research on athletes).\n"
+    "KEEP local community news that is NOT primarily about sport (local politics, "
+    "infrastructure, business, community events).\n"
+    "REMOVE local articles whose primary subject is a sports game, score, result, "
+    "draft, trade, player stat, or team recap — the [LOCAL] tag does not exempt "
+    "sports coverage.\n"
+    "KEEP ai-tech articles with hands-on content, research findings, or practical guides.\n\n"
+    "Respond ONLY with valid JSON: {\"remove\": [list of article numbers to remove]}\n"
+    "If nothing should be removed respond with: {\"remove\": []}"
+)
+
+
 def scrub_feed_with_haiku(articles: List[Article], api_key: str) -> Tuple[List[Article], Dict]:
     """Final headline-only pass with Haiku to catch unwanted subjects that slipped through keyword filters.
 
@@ -2925,48 +3616,16 @@ def scrub_feed_with_haiku(articles: List[Article], api_key: str) -> Tuple[List[A
         for a in auto_removed:
             cohere_removed_by_category[a.category or 'news'] += 1
 
-    client = anthropic.Anthropic(api_key=api_key)
-
-    system_prompt = (
-        "You are a strict content filter reviewing article headlines.\n\n"
-        "Each headline is prefixed with its category and relevance score, e.g. [ai-tech, score=22].\n\n"
-        "Remove articles whose PRIMARY subject is one of:\n"
-        "- Sports: game scores/recaps, drafts, trades, player stats, sports leagues "
-        "(NFL, NBA, NHL, MLB, CFL, MLS, UFC, MMA, FIFA, PGA, NASCAR, Premier League, "
-        "Champions League, World Cup, Olympics, Super Bowl), sports tournaments, "
-        "championships, playoff coverage, athlete profiles focused on sport performance\n"
-        "- Celebrity gossip: tabloid content, paparazzi, red carpet, award show results, "
-        "celebrity relationships/feuds\n"
-        "- Deals/promotions: promo codes, coupons, flash sales, best deals roundups, "
-        "discount codes\n"
-        "- Advice columns: Dear Abby, Ask Amy, Miss Manners, relationship/dating advice\n"
-        "- Fluffy AI/tech (ONLY for ai-tech or homelab category articles): "
-        "pure funding/valuation announcements ('raises $X million', 'valued at $Y billion', "
-        "'goes public'), product launch press releases with no hands-on content, "
-        "AI benchmark releases with no practical application ('scores X on Y benchmark'), "
-        "conference keynote summaries that are pure announcement without substance, "
-        "'X is transforming Y' hype takes without specific findings or implementation detail. "
-        "Be more lenient for higher-scored articles (score >= 40) — only remove clear fluff.\n\n"
-        "KEEP articles that use sports/entertainment as context for a deeper story "
-        "(e.g. technology in sports, economics of a league, health research on athletes).\n"
-        "KEEP local community news that is NOT primarily about sport (local politics, "
-        "infrastructure, business, community events).\n"
-        "REMOVE local articles whose primary subject is a sports game, score, result, "
-        "draft, trade, player stat, or team recap — the [LOCAL] tag does not exempt "
-        "sports coverage.\n"
-        "KEEP ai-tech articles with hands-on content, research findings, or practical guides.\n\n"
-        "Respond ONLY with valid JSON: {\"remove\": [list of article numbers to remove]}\n"
-        "If nothing should be removed respond with: {\"remove\": []}"
-    )
+    client = _anthropic_client(api_key)
 
     kept: List[Article] = []
     total_removed = auto_removed_count
     haiku_removed_by_category: Dict[str, int] = defaultdict(int)
 
     batch_size = LIMITS.get('haiku_scrub_batch_size', 40)
-    for i in range(0, len(articles), batch_size):
-        batch = articles[i:i + batch_size]
+    batches = [articles[i:i + batch_size] for i in range(0, len(articles), batch_size)]
 
+    def _request(batch: List[Article]) -> set:
         # Build numbered headline list with category+score hint so Haiku can apply
         # category-aware filtering (e.g. stricter on low-scoring ai-tech articles).
         lines = []
@@ -2983,43 +3642,46 @@ def scrub_feed_with_haiku(articles: List[Article], api_key: str) -> Tuple[List[A
 
         prompt = f"Review these headlines and identify any whose primary subject is unwanted:\n\n{headlines_text}"
 
-        try:
-            response = client.messages.create(
-                model="claude-haiku-4-5",
-                max_tokens=300,
-                system=system_prompt,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            api_usage.record_claude_usage(response.usage)
-
-            raw = response.content[0].text.strip()
-            # Strip markdown fences if present
-            if raw.startswith("```"):
-                lines_r = raw.splitlines()
-                inner = lines_r[1:]
-                if inner and inner[-1].strip() == "```":
-                    inner = inner[:-1]
-                raw = "\n".join(inner).strip()
-
-            # Use raw_decode so trailing text after the JSON object doesn't
-            # cause "Extra data" errors (model sometimes appends a note).
-            start = raw.find('{')
-            if start == -1:
-                raise ValueError("No JSON object in response")
-            result, _ = json.JSONDecoder().raw_decode(raw, start)
-            remove_nums = set(result.get("remove", []))
-
-            for j, article in enumerate(batch):
-                if (j + 1) in remove_nums:
-                    print(f"  ✂️  Scrubbed: {article.title[:90]}")
-                    total_removed += 1
-                    haiku_removed_by_category[article.category or 'news'] += 1
-                else:
-                    kept.append(article)
-
-        except Exception as e:
-            print(f"  ⚠️ Scrub batch {i // batch_size + 1} failed ({e}), keeping all")
+        response = client.messages.create(
+            model="claude-haiku-4-5",
+            max_tokens=300,
+            system=_SCRUB_SYSTEM_PROMPT,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        api_usage.record_claude_usage(response.usage)
+
+        raw = response.content[0].text.strip()
+        # Strip markdown fences if present
+        if raw.startswith("```"):
+            lines_r = raw.splitlines()
+            inner = lines_r[1:]
+            if inner and inner[-1].strip() == "```":
+                inner = inner[:-1]
+            raw = "\n".join(inner).strip()
+
+        # Use raw_decode so trailing text after the JSON object doesn't
+        # cause "Extra data" errors (model sometimes appends a note).
+        start = raw.find('{')
+        if start == -1:
+            raise ValueError("No JSON object in response")
+        result, _ = json.JSONDecoder().raw_decode(raw, start)
+        return set(result.get("remove", []))
+
+    # Batches are independent headline lists, so send them concurrently and
+    # apply the verdicts in batch order.
+    for batch_num, (batch, (remove_nums, error)) in enumerate(
+            zip(batches, _call_batches(_request, batches)), start=1):
+        if error is not None:
+            print(f"  ⚠️ Scrub batch {batch_num} failed ({error}), keeping all")
             kept.extend(batch)
+            continue
+        for j, article in enumerate(batch):
+            if (j + 1) in remove_nums:
+                print(f"  ✂️  Scrubbed: {article.title[:90]}")
+                total_removed += 1
+                haiku_removed_by_category[article.category or 'news'] += 1
+            else:
+                kept.append(article)
 
     if total_removed:
         print(f"✂️  Final scrub removed {total_removed} article(s) from {len(articles)} quality articles")
@@ -3101,11 +3763,16 @@ def apply_feed_slot_allocation(articles: List[Article]) -> List[Article]:
 
     default_cfg = FEED_SLOTS.get('default', {'min_slots': 1, 'max_slots': 5})
 
+    # Sort once; both passes walk the same score order.
+    ranked = sorted(articles, key=lambda x: x.score, reverse=True)
+
     # Group by category, best composite score first within each group
     by_cat: Dict[str, List[Article]] = defaultdict(list)
-    for a in sorted(articles, key=lambda x: x.score, reverse=True):
+    for a in ranked:
         by_cat[a.category or 'news'].append(a)
 
+    # Resolve slot limits once per category rather than once per article
+    max_slots: Dict[str, int] = {}
     result: List[Article] = []
     cat_counts: Dict[str, int] = defaultdict(int)
 
@@ -3113,6 +3780,7 @@ def apply_feed_slot_allocation(articles: List[Article]) -> List[Article]:
     for cat, arts in by_cat.items():
         cfg = FEED_SLOTS.get(cat, default_cfg)
         min_s = cfg.get('min_slots', default_cfg.get('min_slots', 1))
+        max_slots[cat] = cfg.get('max_slots', default_cfg.get('max_slots', 5))
         for a in arts[:min_s]:
             result.append(a)
             cat_counts[cat] += 1
@@ -3120,13 +3788,11 @@ def apply_feed_slot_allocation(articles: List[Article]) -> List[Article]:
     included_ids = {id(a) for a in result}
 
     # Pass 2: fill remaining capacity greedily by composite score up to max_slots
-    remaining = [a for a in sorted(articles, key=lambda x: x.score, reverse=True)
-                 if id(a) not in included_ids]
-    for a in remaining:
+    for a in ranked:
+        if id(a) in included_ids:
+            continue
         cat = a.category or 'news'
-        cfg = FEED_SLOTS.get(cat, default_cfg)
-        max_s = cfg.get('max_slots', default_cfg.get('max_slots', 5))
-        if cat_counts[cat] < max_s:
+        if cat_counts[cat] < max_slots[cat]:
             result.append(a)
             cat_counts[cat] += 1
 
@@ -3263,22 +3929,30 @@ def apply_diversity_limits(articles: List[Article], category: str) -> List[Artic
     source_map = SOURCE_PREFS.get('source_map', {})
     source_types = SOURCE_PREFS.get('source_types', {})
 
-    source_counts = defaultdict(int)
-    diverse_articles = []
+    # Bucket by source, keep each source's top-N with nlargest (O(N log k)
+    # instead of a full sort), then restore global score order. The input
+    # index breaks ties so the result matches a stable sort-and-count pass.
+    by_source: Dict[str, List[Tuple[int, Article]]] = defaultdict(list)
+    for idx, article in enumerate(articles):
+        by_source[article.source].append((idx, article))
 
-    sorted_articles = sorted(articles, key=lambda a: a.score, reverse=True)
-
-    for article in sorted_articles:
+    kept: List[Tuple[int, Article]] = []
+    for source, group in by_source.items():
         # Determine per-source limit: use source type override if available
-        source_type = source_map.get(article.source)
+        source_type = source_map.get(source)
         if source_type and source_type in source_types:
             max_for_source = source_types[source_type].get('max_per_source', default_max)
         else:
             max_for_source = default_max
 
-        if source_counts[article.source] < max_for_source:
-            diverse_articles.append(article)
-            source_counts[article.source] += 1
+        # Most sources are under their cap; the final sort orders them anyway.
+        if len(group) <= max_for_source:
+            kept.extend(group)
+        else:
+            kept.extend(heapq.nlargest(max_for_source, group, key=lambda pair: pair[1].score))
+
+    kept.sort(key=lambda pair: (-pair[1].score, pair[0]))
+    diverse_articles = [article for _, article in kept]
 
     print(f"📊 Diversity filter ({category}): {len(articles)} → {len(diverse_articles)} articles")
     return diverse_articles
@@ -3299,6 +3973,7 @@ _DAY_ABBREV = {
     "monday": "Mon", "tuesday": "Tue", "wednesday": "Wed",
     "thursday": "Thu", "friday": "Fri", "saturday": "Sat", "sunday": "Sun",
 }
+_DAY_ORDER = {day: i for i, day in enumerate(_DAY_ABBREV)}
 
 _DAY_EMOJI = {
     "monday":    "🎨",  # Arts & Culture
@@ -3343,11 +4018,30 @@ def _make_score_badge(
     return f'<p style="{_BADGE_STYLE}">{emojis} {fix_link}</p>\n'
 
 
-def generate_json_feed(articles: List[Article], category: str, output_path: str):
+def _podcast_days_by_link(podcast_shown_cache: Dict) -> Dict[str, List[str]]:
+    """Map article URL → podcast days it appeared on, in weekday order.
+
+    Built once from the "{url}:::{day}" keyed cache so feed generation does a
+    dict lookup per item instead of scanning every cache key.
+    """
+    days_by_link: Dict[str, set] = defaultdict(set)
+    for key, entry in podcast_shown_cache.items():
+        link, sep, _ = key.rpartition(':::')
+        if sep:
+            days_by_link[link].add(entry['day'])
+    return {
+        link: sorted(days, key=lambda d: _DAY_ORDER.get(d, 99))
+        for link, days in days_by_link.items()
+    }
+
+
+def generate_json_feed(articles: List[Article], category: str, output_path: str,
+                       podcast_days_index: Optional[Dict[str, List[str]]] = None) -> None:
     """Generate JSON Feed format output"""
     cat_config = CATEGORIES[category]
     feed_config = FEEDS_CONFIG['feeds'][category]
-    podcast_shown_cache = load_podcast_shown_cache()
+    if podcast_days_index is None:
+        podcast_days_index = _podcast_days_by_link(load_podcast_shown_cache())
 
     feed = {
         "version": "https://jsonfeed.org/version/1.1",
@@ -3379,11 +4073,7 @@ def generate_json_feed(articles: List[Article], category: str, output_path: str)
         if _us_scope:
             item_tags.append("us-policy")
 
-        podcast_days = sorted({
-            entry['day']
-            for key, entry in podcast_shown_cache.items()
-            if key.startswith(f"{article.link}:::")
-        }, key=lambda d: list(_DAY_ABBREV.keys()).index(d) if d in _DAY_ABBREV else 99)
+        podcast_days = podcast_days_index.get(article.link, [])
 
         badge = _make_score_badge(
             score=article.score,
@@ -3435,7 +4125,7 @@ def generate_json_feed(articles: List[Article], category: str, output_path: str)
             item["title"] = f"🔓 {item['title']}"
             item["_subscriber_access"] = subscriber_label
             if subscriber_label.startswith("Apple News"):
-                _clean = re.sub(r'^\[.*?\]\s*', '', article.title)
+                _clean = _SOURCE_PREFIX_RE.sub('', article.title)
                 item["_apple_news_url"] = build_apple_news_search_url(_clean or article.title)
 
         feed["items"].append(item)
@@ -3446,7 +4136,7 @@ def generate_json_feed(articles: List[Article], category: str, output_path: str)
     print(f"✅ Generated {category} feed: {len(feed['items'])} articles")
 
 
-def load_podcast_schedule():
+def load_podcast_schedule() -> Optional[Dict]:
     """Load podcast schedule configuration"""
     try:
         return config_loader.load_podcast_schedule_config()
@@ -3456,9 +4146,12 @@ def load_podcast_schedule():
 
 
 def _keyword_match_count(text: str, keywords: List[str]) -> int:
-    """Count how many keywords appear in the text (case-insensitive)."""
+    """Count how many keywords appear in the text (case-insensitive).
+
+    Keywords must already be lowercase — callers lower each theme's list once.
+    """
     text_lower = text.lower()
-    return sum(1 for kw in keywords if kw.lower() in text_lower)
+    return sum(1 for kw in keywords if kw in text_lower)
 
 
 def _net_keyword_match_count(text: str, keywords: List[str], anti_keywords: List[str]) -> int:
@@ -3523,7 +4216,7 @@ def score_articles_for_theme(articles: List[Article], theme_prompt: str, theme_l
         save_theme_score_cache(theme_cache)
         return scored_results
 
-    client = anthropic.Anthropic(api_key=api_key)
+    client = _anthropic_client(api_key)
 
     # Theme fit must be judged by the theme's own editorial charter, NOT the
     # personal interest profile — embedding scoring_interests.txt here skewed
@@ -3556,19 +4249,13 @@ def score_articles_for_theme(articles: List[Article], theme_prompt: str, theme_l
         f"{US_POLICY_SCORING_GUIDANCE}"
     )
 
-    batch_size = 30
-
-    for i in range(0, len(uncached), batch_size):
-        batch = uncached[i:i + batch_size]
-        batch_start_count = len(scored_results)
-
-        try:
-            articles_text = "\n\n".join([
-                f"Article {j+1}:\nTitle: {article.title}\nSource: {article.source}\nDescription: {(article.description or '')[:300]}"
-                for j, article in enumerate(batch)
-            ])
+    def _request(batch):
+        articles_text = "\n\n".join([
+            f"Article {j+1}:\nTitle: {article.title}\nSource: {article.source}\nDescription: {article.summary}"
+            for j, article in enumerate(batch)
+        ])
 
-            prompt = f"""Rate each article 0-100 for theme fit.
+        prompt = f"""Rate each article 0-100 for theme fit.
 
 Respond with ONLY a JSON array (no other text):
 [
@@ -3579,18 +4266,29 @@ Respond with ONLY a JSON array (no other text):
 Articles to evaluate:
 {articles_text}"""
 
-            response = client.messages.create(
-                model="claude-haiku-4-5",
-                max_tokens=750,
-                system=[
-                    {
-                        "type": "text",
-                        "text": cached_theme_system,
-                        "cache_control": {"type": "ephemeral", "ttl": "1h"}
-                    }
-                ],
-                messages=[{"role": "user", "content": prompt}]
-            )
+        return client.messages.create(
+            model="claude-haiku-4-5",
+            max_tokens=750,
+            system=[
+                {
+                    "type": "text",
+                    "text": cached_theme_system,
+                    "cache_control": {"type": "ephemeral", "ttl": "1h"}
+                }
+            ],
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+    batch_size = 30
+    batches = [uncached[i:i + batch_size] for i in range(0, len(uncached), batch_size)]
+
+    for batch, (response, error) in zip(batches, _call_batches(_request, batches)):
+        batch_start_count = len(scored_results)
+
+        try:
+            if error is not None:
+                raise error
+
             api_usage.record_claude_usage(response.usage)
 
             response_text = response.content[0].text.strip()
@@ -3637,7 +4335,7 @@ Articles to evaluate:
     return scored_results
 
 
-def score_all_themes_at_ingest(articles: List[Article], schedule_config: Dict, api_key: str):
+def score_all_themes_at_ingest(articles: List[Article], schedule_config: Dict, api_key: str) -> None:
     """Score new articles against all podcast themes in one pass at ingest time.
 
     Called once per run after quality articles are saved to the podcast cache.
@@ -3682,7 +4380,7 @@ def score_all_themes_at_ingest(articles: List[Article], schedule_config: Dict, a
         print(f"   ✅ Cohere theme scoring complete ({len(uncached)} articles × {len(schedule)} themes cached)")
         return
 
-    client = anthropic.Anthropic(api_key=api_key)
+    client = _anthropic_client(api_key)
 
     # Theme fit is judged by each theme's editorial charter alone — the personal
     # interest profile must NOT appear here (it skewed every theme score toward
@@ -3714,7 +4412,7 @@ def score_all_themes_at_ingest(articles: List[Article], schedule_config: Dict, a
     for i in range(0, len(uncached), batch_size):
         batch = uncached[i:i + batch_size]
         articles_text = "\n\n".join(
-            f"Article {j+1}:\nTitle: {a.title}\nSource: {a.source}\nDescription: {(a.description or '')[:300]}"
+            f"Article {j+1}:\nTitle: {a.title}\nSource: {a.source}\nDescription: {a.summary}"
             for j, a in enumerate(batch)
         )
         prompt = f"""Rate each article 0-100 for every theme key listed in the system prompt.
@@ -3756,10 +4454,11 @@ Articles to evaluate:
               f" ({len(uncached)} articles × {len(schedule)} themes)")
     except Exception as e:
         print(f"  ⚠️ Batch submission failed, falling back to synchronous scoring: {e}")
-        for i in range(0, len(uncached), batch_size):
-            batch = uncached[i:i + batch_size]
+        batches = [uncached[i:i + batch_size] for i in range(0, len(uncached), batch_size)]
+
+        def _request(batch):
             articles_text = "\n\n".join(
-                f"Article {j+1}:\nTitle: {a.title}\nSource: {a.source}\nDescription: {(a.description or '')[:300]}"
+                f"Article {j+1}:\nTitle: {a.title}\nSource: {a.source}\nDescription: {a.summary}"
                 for j, a in enumerate(batch)
             )
             prompt = f"""Rate each article 0-100 for every theme key listed in the system prompt.
@@ -3772,14 +4471,19 @@ Respond with ONLY a JSON array (no other text):
 
 Articles to evaluate:
 {articles_text}"""
+            return client.messages.create(
+                model="claude-haiku-4-5",
+                max_tokens=2500,
+                system=[{"type": "text", "text": combined_system,
+                         "cache_control": {"type": "ephemeral", "ttl": "1h"}}],
+                messages=[{"role": "user", "content": prompt}]
+            )
+
+        for batch_num, (batch, (response, error)) in enumerate(
+                zip(batches, _call_batches(_request, batches)), start=1):
             try:
-                response = client.messages.create(
-                    model="claude-haiku-4-5",
-                    max_tokens=2500,
-                    system=[{"type": "text", "text": combined_system,
-                             "cache_control": {"type": "ephemeral", "ttl": "1h"}}],
-                    messages=[{"role": "user", "content": prompt}]
-                )
+                if error is not None:
+                    raise error
                 api_usage.record_claude_usage(response.usage)
                 response_text = response.content[0].text.strip()
                 if response_text.startswith('```'):
@@ -3812,7 +4516,7 @@ Articles to evaluate:
                             if key not in theme_cache:
                                 theme_cache[key] = {'score': 50, 'cached_at': now_iso}
             except (json.JSONDecodeError, Exception) as sync_err:
-                print(f"  ⚠️ Sync fallback error (batch {i//batch_size + 1}): {sync_err}")
+                print(f"  ⚠️ Sync fallback error (batch {batch_num}): {sync_err}")
                 for article in batch:
                     for cfg in schedule.values():
                         key = f"{article.link}:::{cfg['label']}"
@@ -4045,13 +4749,17 @@ def generate_podcast_feed(theme_name: str, cached_articles: List[Dict], podcast_
     # Convert cached article dicts to Article objects
     # Create a simple Article-like class for cached articles
     class CachedArticle:
+        __slots__ = ('title', 'link', 'description', 'summary', 'excerpt', 'pub_date',
+                     'source', 'source_url', 'score', 'quality', 'relevance', 'local',
+                     'q_gate', 'content_type', 'category', 'image')
+
         def __init__(self, data):
             self.title = data['title']
             self.link = data['link']
             self.description = data['description']
             self.summary = data.get('summary', '') or _clean_text(data['description'], max_chars=300)
             self.excerpt = data.get('excerpt', '') or _clean_text(data['description'], max_chars=600)
-            self.pub_date = datetime.fromisoformat(data['pub_date'])
+            self.pub_date = _parse_cached_pub_date(data['pub_date'])
             self.source = data['source']
             self.source_url = data['source_url']
             self.score = data['score']
@@ -4173,9 +4881,8 @@ def generate_podcast_feed(theme_name: str, cached_articles: List[Dict], podcast_
         protected_links = {a.link for a in rescued} | {a.link for a in holdover_pool}
         protected = [a for a in theme_pool if a.link in protected_links]
         cappable = [a for a in theme_pool if a.link not in protected_links]
-        cappable.sort(key=lambda a: a.score, reverse=True)
         room = max(0, POOL_CAP - len(protected))
-        theme_pool = protected + cappable[:room]
+        theme_pool = protected + heapq.nlargest(room, cappable, key=lambda a: a.score)
         print(f"  📊 Pool capped at top {room} direct-qualify articles by quality score "
               f"(+{len(protected)} rescued/holdover exempted from cap)")
 
@@ -4500,7 +5207,7 @@ def generate_podcast_feed(theme_name: str, cached_articles: List[Dict], podcast_
         if subscriber_label:
             item["_subscriber_access"] = subscriber_label
             if subscriber_label.startswith("Apple News"):
-                _clean = re.sub(r'^\[.*?\]\s*', '', article.title)
+                _clean = _SOURCE_PREFIX_RE.sub('', article.title)
                 item["_apple_news_url"] = build_apple_news_search_url(_clean or article.title)
 
         # Mark articles that previously appeared in a different theme's episode
@@ -4558,8 +5265,11 @@ def generate_podcast_feed(theme_name: str, cached_articles: List[Dict], podcast_
     return {a.link for a, _, _ in all_entries}, feed_stats
 
 
-def generate_opml():
-    """Generate OPML file with all category feeds and podcast feeds"""
+def generate_opml(schedule_config: Optional[Dict] = None) -> None:
+    """Generate OPML file with all category feeds and podcast feeds.
+
+    Pass the already-loaded podcast schedule to avoid re-reading it.
+    """
     import xml.etree.ElementTree as ET
 
     opml = ET.Element('opml', version='1.0')
@@ -4588,7 +5298,8 @@ def generate_opml():
         })
 
     # Add podcast feeds
-    schedule_config = load_podcast_schedule()
+    if schedule_config is None:
+        schedule_config = load_podcast_schedule()
     if schedule_config and schedule_config.get('enabled', False):
         podcast_folder = ET.SubElement(body, 'outline', {
             'text': '🎙️ Themed Podcast Feeds',
@@ -4612,7 +5323,7 @@ def generate_opml():
     print("✅ Generated OPML file: curated-feeds.opml")
 
 
-def main():
+def main() -> None:
     api_key = os.getenv('ANTHROPIC_API_KEY')
     if not api_key:
         print("❌ Error: ANTHROPIC_API_KEY environment variable not set")
@@ -4632,22 +5343,36 @@ def main():
     cutoff_date = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
     print(f"\n📥 Fetching articles from last {lookback_hours} hours...")
 
-    _feed_http_cache.load()
     all_articles = []
-    for feed in feeds:
-        articles = fetch_feed_articles(feed, cutoff_date)
-        all_articles.extend(articles)
-    _feed_http_cache.save()
+    # The WLT scrape and the topic-query / Kite fetches don't depend on the
+    # OPML feeds, so start them first and let their network waits overlap
+    # with the feed pool. Results are still merged in the original order.
+    # Those side fetches print progress while the main thread prints feed
+    # status, so stdout is kept line-atomic for the duration.
+    with _line_atomic_stdout(), \
+            concurrent.futures.ThreadPoolExecutor(max_workers=3) as side_pool:
+        wlt_future = side_pool.submit(scrape_wlt_news)
+        topic_future = side_pool.submit(fetch_topic_news, cutoff_date)
+        kite_future = side_pool.submit(fetch_kite_news, cutoff_date)
+
+        _feed_http_cache.load()
+        # Feed fetches are independent and network-bound, so overlap the waits.
+        # pool.map yields in OPML order, keeping downstream dedup tie-breaks
+        # stable; each feed's status lines are printed here, in that order.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=FEED_FETCH_WORKERS) as pool:
+            for articles, status_lines in pool.map(
+                    lambda feed: _fetch_feed_with_status(feed, cutoff_date), feeds):
+                for line in status_lines:
+                    print(line)
+                all_articles.extend(articles)
+        _feed_http_cache.save()
 
     all_articles = apply_prescore_filter(all_articles)
 
-    wlt_articles = scrape_wlt_news()
+    wlt_articles = wlt_future.result()
+    wlt_hashes = set()
     for wlt_entry in wlt_articles:
-        class WLTEntry:
-            def get(self, key, default=''):
-                return wlt_entry.get(key, default)
-        
-        article = Article(WLTEntry(), 'Williams Lake Tribune', WLT_BASE_URL)
+        article = Article(_AttrDict(wlt_entry), 'Williams Lake Tribune', WLT_BASE_URL)
         article.title = wlt_entry['title']
         article.link = wlt_entry['link']
         article.description = wlt_entry['description']
@@ -4656,12 +5381,13 @@ def main():
         article.image = wlt_entry.get('image')
         article.score = LIMITS['local_priority_score']
         article.category = 'local'
+        wlt_hashes.add(article.url_hash)
         all_articles.append(article)
 
-    topic_articles = fetch_topic_news(cutoff_date)
+    topic_articles = topic_future.result()
     all_articles.extend(topic_articles)
 
-    kite_articles = fetch_kite_news(cutoff_date)
+    kite_articles = kite_future.result()
     all_articles.extend(kite_articles)
 
     print(f"\n📈 Total fetched: {len(all_articles)} articles")
@@ -4679,20 +5405,27 @@ def main():
         for v in shown_terms_cache.values()
         if v.get('terms')
     ]
+    stored_term_index = _index_term_sets(stored_term_sets)
 
     new_articles = []
     story_dupes = 0
+    blocked = 0
     for a in unique_articles:
         if a.url_hash in shown_cache:
             continue
+        # RSS entries were filtered at fetch time, but the search fallbacks,
+        # topic queries and Kite build Articles directly. Apply the same
+        # keyword/source blocklists here so none of them reach paid scoring.
+        # WLT scrapes stay exempt: the local paper's own stories (local sports
+        # included) have always gone through to scoring as priority local items.
+        if a.url_hash not in wlt_hashes and a.should_filter():
+            blocked += 1
+            continue
         # Cross-run story dedup: skip if ≥3 significant terms overlap with a
         # recently-shown article at ≥50% containment similarity.
         if (a.title_terms
                 and len(a.title_terms) >= 3
-                and any(
-                    _story_overlap(a.title_terms, stored) >= 0.50
-                    for stored in stored_term_sets
-                )):
+                and _overlaps_indexed(a.title_terms, stored_term_sets, stored_term_index, 0.50)):
             story_dupes += 1
             continue
         new_articles.append(a)
@@ -4700,6 +5433,7 @@ def main():
     print(
         f"🆕 New articles (not previously shown): {len(unique_articles)} → {len(new_articles)}"
         + (f"  ({story_dupes} cross-run story dupes suppressed)" if story_dupes else "")
+        + (f"  ({blocked} blocked by filters)" if blocked else "")
     )
 
     run_stats['ingest'] = {
@@ -4707,6 +5441,7 @@ def main():
         'deduped': len(unique_articles),
         'new': len(new_articles),
         'cross_run_story_dupes': story_dupes,
+        'blocked_after_fetch': blocked,
     }
 
     if kagi_key := os.environ.get('KAGI_API_KEY', ''):
@@ -4753,10 +5488,9 @@ def main():
         # intake to the highest-quality candidates to bound API cost.
         _pod_cap = LIMITS.get('podcast_candidate_max_per_run', 250)
         if len(podcast_candidates) > _pod_cap:
-            podcast_candidates.sort(
-                key=lambda a: (_podcast_quality(a) or 0, getattr(a, 'local', 0)),
-                reverse=True)
-            podcast_candidates = podcast_candidates[:_pod_cap]
+            podcast_candidates = heapq.nlargest(
+                _pod_cap, podcast_candidates,
+                key=lambda a: (_podcast_quality(a) or 0, getattr(a, 'local', 0)))
 
         print(f"🎙️  Podcast candidate branch: {len(podcast_candidates)} articles "
               f"(from {len(scored_articles)} scored, quality floor {_pod_floor}, "
@@ -4826,9 +5560,7 @@ def main():
     if min_per_cat:
         quality_urls = {a.url_hash for a in quality_articles}
         subthreshold = [a for a in scrubbed if a.url_hash not in quality_urls] + scrub_below
-        quality_by_cat: Dict[str, int] = defaultdict(int)
-        for a in quality_articles:
-            quality_by_cat[a.category or 'news'] += 1
+        quality_by_cat: Dict[str, int] = Counter(a.category or 'news' for a in quality_articles)
         by_cat: Dict[str, List[Article]] = defaultdict(list)
         for a in subthreshold:
             by_cat[a.category or 'news'].append(a)
@@ -4836,8 +5568,7 @@ def main():
         for cat, floor in min_per_cat.items():
             need = floor - quality_by_cat.get(cat, 0)
             if need > 0:
-                top = sorted(by_cat.get(cat, []), key=lambda a: a.score, reverse=True)
-                rescued.extend(top[:need])
+                rescued.extend(heapq.nlargest(need, by_cat.get(cat, []), key=lambda a: a.score))
         if rescued:
             print(f"🌱 Category floors rescued {len(rescued)} additional articles")
             quality_articles.extend(rescued)
@@ -4848,12 +5579,9 @@ def main():
     # limits.json knobs remain in effect.
     quality_articles = apply_feed_slot_allocation(quality_articles)
 
-    scrubbed_by_cat: Dict[str, int] = defaultdict(int)
-    for a in scrubbed:
-        scrubbed_by_cat[a.category or 'news'] += 1
-    passed_by_cat: Dict[str, int] = defaultdict(int)
-    for a in quality_articles:
-        passed_by_cat[a.category or 'news'] += 1
+    # Counter tallies in C; one pass per pool instead of a Python += per article
+    scrubbed_by_cat: Dict[str, int] = Counter(a.category or 'news' for a in scrubbed)
+    passed_by_cat: Dict[str, int] = Counter(a.category or 'news' for a in quality_articles)
     run_stats['quality_gate'] = {
         'passed_count': len(quality_articles),
         'passed_by_category': dict(passed_by_cat),
@@ -5004,6 +5732,7 @@ def main():
     retention_cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
 
     final_feed_sizes: Dict[str, int] = {}
+    podcast_days_index = _podcast_days_by_link(load_podcast_shown_cache())
 
     for cat_key in CATEGORIES.keys():
         feed_file = f"feed-{cat_key}.json"
@@ -5016,7 +5745,7 @@ def main():
                     for item in existing_feed.get('items', []):
                         pub_date = datetime.fromisoformat(item['date_published'].replace('Z', '+00:00'))
                         if pub_date > retention_cutoff:
-                            existing_articles.append(item)
+                            existing_articles.append((item, pub_date))
             except Exception as e:
                 print(f"⚠️ Error loading existing {cat_key} feed: {e}")
         
@@ -5039,49 +5768,34 @@ def main():
         merge_overlap = LIMITS.get('feed_merge_overlap_threshold', 0.50)
         merge_min_terms = LIMITS.get('feed_merge_min_terms', 2)
         new_urls = {a.link for a in diverse_new}
-        new_term_sets = [(a.title_terms) for a in diverse_new]
+        new_term_sets = [a.title_terms for a in diverse_new if len(a.title_terms) >= merge_min_terms]
+        new_term_index = _index_term_sets(new_term_sets)
 
         def _retained_is_fresh(item: dict) -> bool:
             if item['url'] in new_urls:
                 return False
-            _raw_title = re.sub(r'^(?:🔓\s*)+', '', item.get('title', ''))
-            r_terms = _term_set(re.sub(r'^\[.*?\]\s*', '', _raw_title).lower())
+            _raw_title = _UNLOCK_PREFIX_RE.sub('', item.get('title', ''))
+            r_terms = _term_set(_SOURCE_PREFIX_RE.sub('', _raw_title).lower())
             if len(r_terms) < merge_min_terms:
                 return True
-            for nt in new_term_sets:
-                if len(nt) >= merge_min_terms:
-                    ov = _story_overlap(r_terms, nt)
-                    if ov >= merge_overlap and len(r_terms & nt) >= merge_min_terms:
-                        return False
-            return True
-
-        fresh_existing = [item for item in existing_articles if _retained_is_fresh(item)]
-        if len(fresh_existing) < len(existing_articles):
-            print(f"🗂️  Feed merge dedup ({cat_key}): {len(existing_articles)} → {len(fresh_existing)} retained articles")
+            return not _overlaps_indexed(r_terms, new_term_sets, new_term_index,
+                                         merge_overlap, merge_min_terms)
 
+        # Wrap retained items in the same pass that filters them; existing_articles
+        # holds (item, parsed date_published) from the retention check.
         all_items = diverse_new + [
-            type('Article', (), {
-                'link': item['url'],
-                'title': re.sub(r'^(?:🔓\s*)+', '', item['title']),
-                'description': item['content_html'],
-                'pub_date': datetime.fromisoformat(item['date_published'].replace('Z', '+00:00')),
-                'source': item['authors'][0]['name'],
-                'source_url': item['authors'][0]['url'],
-                'score': item.get('_score', 0),
-                'quality': item.get('_quality', 0),
-                'relevance': item.get('_relevance', 0),
-                'local': item.get('_local_score', 0),
-                'content_type': item.get('_content_type'),
-                'image': item.get('image')
-            })() for item in fresh_existing
+            _RetainedArticle(item, pub_date) for item, pub_date in existing_articles
+            if _retained_is_fresh(item)
         ]
-        
-        all_items.sort(key=lambda a: a.pub_date, reverse=True)
-        all_items = all_items[:LIMITS['max_feed_size']]
+        retained_count = len(all_items) - len(diverse_new)
+        if retained_count < len(existing_articles):
+            print(f"🗂️  Feed merge dedup ({cat_key}): {len(existing_articles)} → {retained_count} retained articles")
+
+        all_items = heapq.nlargest(LIMITS['max_feed_size'], all_items, key=lambda a: a.pub_date)
 
         final_feed_sizes[cat_key] = len(all_items)
 
-        generate_json_feed(all_items, cat_key, feed_file)
+        generate_json_feed(all_items, cat_key, feed_file, podcast_days_index)
 
     run_stats['final_feeds'] = final_feed_sizes
 
@@ -5095,7 +5809,7 @@ def main():
     _shown_cache.save(shown_cache)
     _shown_terms_cache.save(shown_terms_cache)
     
-    generate_opml()
+    generate_opml(schedule_config)
     
     print("\n📊 Final stats:")
     print(f"  Total sources: {len(feeds)}")
@@ -5298,7 +6012,7 @@ def generate_review_feed(quality_articles: List[Article], scrubbed: List[Article
           f"{len(reviewed_urls)} already-reviewed excluded)")
 
 
-def bootstrap_feeds_from_podcast_cache(api_key: str = ''):
+def bootstrap_feeds_from_podcast_cache(api_key: str = '') -> None:
     """Repopulate empty feed JSON files from the podcast articles cache.
 
     Reads podcast_articles_cache.json (7-day retention) and re-scores every
@@ -5338,7 +6052,7 @@ def bootstrap_feeds_from_podcast_cache(api_key: str = ''):
             skipped += 1
             continue
         try:
-            pub_date = datetime.fromisoformat(item['pub_date'])
+            pub_date = _parse_cached_pub_date(item['pub_date'])
         except Exception:
             skipped += 1
             continue
@@ -5522,8 +6236,8 @@ def bootstrap_feeds_from_podcast_cache(api_key: str = ''):
             existing_urls.add(article.link)
             added += 1
 
-        feed['items'].sort(key=lambda x: x.get('date_published', ''), reverse=True)
-        feed['items'] = feed['items'][:LIMITS['max_feed_size']]
+        feed['items'] = heapq.nlargest(LIMITS['max_feed_size'], feed['items'],
+                                       key=lambda x: x.get('date_published', ''))
 
         with open(feed_file, 'w', encoding='utf-8') as f:
             json.dump(feed, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Check Cache's load()/save() I/O contract.
+
+load() reuses the last text it read or wrote while the file signature is
+unchanged, and save() skips the write when the serialized text matches.
+These tests pin down when a write must (and must not) happen.
+
+Run: python -m unittest test_cache
+"""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import cache as cache_module
+from cache import Cache
+
+
+class CacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'cache.json')
+        self.now = time.time()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_file(self, data) -> None:
+        with open(self.path, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+    def read_file(self):
+        with open(self.path) as f:
+            return json.load(f)
+
+    def save_writes(self, cache: Cache, data: dict) -> bool:
+        """Call cache.save(data) and report whether it opened the file for writing."""
+        with mock.patch.object(cache_module, 'open', create=True, wraps=open) as opened:
+            cache.save(data)
+        return any('w' in call.args[1:2] or call.kwargs.get('mode') == 'w'
+                   for call in opened.call_args_list)
+
+    def test_skips_write_when_unchanged(self):
+        self.write_file({'a': {'v': 1, 'timestamp': self.now}})
+        cache = Cache(self.path, ttl_hours=1, indent=None)
+        self.assertFalse(self.save_writes(cache, cache.load()))
+        # A second round trip after a save stays a no-op too.
+        self.assertFalse(self.save_writes(cache, cache.load()))
+
+    def test_writes_in_place_mutation(self):
+        self.write_file({'a': {'v': 1, 'timestamp': self.now}})
+        cache = Cache(self.path, ttl_hours=1, indent=None)
+        data = cache.load()
+        data['a']['v'] = 2
+        self.assertTrue(self.save_writes(cache, data))
+        self.assertEqual(self.read_file()['a']['v'], 2)
+        self.assertEqual(Cache(self.path).load()['a']['v'], 2)
+
+    def test_unsaved_edits_do_not_leak(self):
+        self.write_file({'a': {'v': 1, 'timestamp': self.now}})
+        cache = Cache(self.path, ttl_hours=1, indent=None)
+        cache.load()['a']['v'] = 2
+        self.assertEqual(cache.load()['a']['v'], 1)
+        saved = cache.load()
+        cache.save(saved)
+        saved['a']['v'] = 3
+        self.assertEqual(cache.load()['a']['v'], 1)
+
+    def test_writes_after_ttl_prune(self):
+        self.write_file({'fresh': {'timestamp': self.now},
+                         'stale': {'timestamp': self.now - 7200}})
+        cache = Cache(self.path, ttl_hours=1, indent=None)
+        data = cache.load()
+        self.assertEqual(set(data), {'fresh'})
+        self.assertTrue(self.save_writes(cache, data))
+        self.assertEqual(set(self.read_file()), {'fresh'})
+
+    def test_rereads_and_writes_after_external_change(self):
+        self.write_file({'a': 1})
+        cache = Cache(self.path, indent=None)
+        original = cache.load()
+        # Let the clock move past the first write so the rewrite's ctime
+        # differs, then rewrite with the same size and restore the mtime.
+        time.sleep(0.05)
+        st = os.stat(self.path)
+        self.write_file({'a': 2})
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertEqual(os.path.getsize(self.path), st.st_size)
+
+        self.assertEqual(cache.load(), {'a': 2})
+        self.assertTrue(self.save_writes(cache, original))
+        self.assertEqual(self.read_file(), {'a': 1})
+
+    def test_save_after_external_change_without_reload(self):
+        self.write_file({'a': 1})
+        cache = Cache(self.path, indent=None)
+        data = cache.load()
+        time.sleep(0.05)
+        self.write_file({'a': 2})
+        self.assertTrue(self.save_writes(cache, data))
+        self.assertEqual(self.read_file(), {'a': 1})
+
+    def test_corrupt_file_loads_empty_and_is_rewritten(self):
+        with open(self.path, 'w') as f:
+            f.write('{"a": ')
+        cache = Cache(self.path, indent=None)
+        self.assertEqual(cache.load(), {})
+        self.assertTrue(self.save_writes(cache, {}))
+        self.assertEqual(self.read_file(), {})
+
+    def test_missing_file_loads_empty_and_is_created(self):
+        cache = Cache(self.path, indent=None)
+        self.assertEqual(cache.load(), {})
+        self.assertTrue(self.save_writes(cache, {'a': 1}))
+        self.assertEqual(self.read_file(), {'a': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
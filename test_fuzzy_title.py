@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Check that _FuzzyTitle.ratio_exceeds agrees with the plain _fuzz_ratio test.
+
+Dedup merges hinge on ratio_exceeds, which rejects most pairs with upper
+bounds (shared characters, bit-parallel LCS) before running the full
+SequenceMatcher. Any drift in those bounds would silently change which
+articles get merged, so compare it against _fuzz_ratio directly.
+
+Run: python -m unittest test_fuzzy_title
+"""
+
+import random
+import unittest
+
+from super_rss_curator_json import _FuzzyTitle, _fuzz_ratio
+
+THRESHOLDS = (0, 50, 78, 78.5, 90, 99, 100)
+
+
+def _random_title(rng: random.Random, alphabet: str, max_len: int) -> str:
+    return ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, max_len)))
+
+
+def _mutate(rng: random.Random, text: str, alphabet: str) -> str:
+    """Apply a few random edits so near-duplicate pairs are well covered."""
+    chars = list(text)
+    for _ in range(rng.randint(1, 4)):
+        op = rng.randrange(3)
+        pos = rng.randint(0, len(chars))
+        if op == 0:
+            chars.insert(pos, rng.choice(alphabet))
+        elif chars and op == 1:
+            del chars[min(pos, len(chars) - 1)]
+        elif chars:
+            chars[min(pos, len(chars) - 1)] = rng.choice(alphabet)
+    return ''.join(chars)
+
+
+class FuzzyTitleTest(unittest.TestCase):
+
+    def assert_agrees(self, a: str, b: str) -> None:
+        # Fresh objects per threshold and reused ones both must agree: the
+        # masks and matcher are built lazily and then cached on the instance.
+        char_bits = {}
+        shared_a, shared_b = _FuzzyTitle(a, char_bits), _FuzzyTitle(b, char_bits)
+        for threshold in THRESHOLDS:
+            expected = _fuzz_ratio(a, b) > threshold
+            fresh_bits = {}
+            self.assertEqual(_FuzzyTitle(b, fresh_bits).ratio_exceeds(_FuzzyTitle(a, fresh_bits),
+                                                                      threshold),
+                             expected, (a, b, threshold))
+            self.assertEqual(shared_b.ratio_exceeds(shared_a, threshold), expected,
+                             (a, b, threshold))
+
+    def test_empty_titles(self):
+        for a, b in (('', ''), ('', 'x'), ('abc', ''), (' ', '')):
+            self.assert_agrees(a, b)
+
+    def test_identical_titles(self):
+        for text in ('a', 'aaaa', 'Council approves budget', 'ééé ß'):
+            self.assert_agrees(text, text)
+
+    def test_duplicate_characters(self):
+        rng = random.Random(1)
+        for _ in range(1000):
+            a = _random_title(rng, 'aab ', 12)
+            self.assert_agrees(a, _random_title(rng, 'abb ', 12))
+            self.assert_agrees(a, _mutate(rng, a, 'ab '))
+
+    def test_random_titles(self):
+        rng = random.Random(2)
+        alphabet = 'abcdefghijklmnopqrstuvwxyz   0123456789-:\'é'
+        for _ in range(1000):
+            a = _random_title(rng, alphabet, 90)
+            self.assert_agrees(a, _random_title(rng, alphabet, 90))
+            self.assert_agrees(a, _mutate(rng, a, alphabet))
+
+    def test_reused_title_against_many(self):
+        # One prepared title checked against a stream of others, as dedup does.
+        rng = random.Random(3)
+        base = 'province announces new wildfire funding for cariboo region'
+        char_bits = {}
+        prepared = _FuzzyTitle(base, char_bits)
+        for _ in range(1000):
+            other = _mutate(rng, base, 'abcdefghijklmnopqrstuvwxyz ')
+            for threshold in THRESHOLDS:
+                self.assertEqual(prepared.ratio_exceeds(_FuzzyTitle(other, char_bits), threshold),
+                                 _fuzz_ratio(other, base) > threshold, (other, threshold))
+
+
+if __name__ == '__main__':
+    unittest.main()